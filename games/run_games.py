@@ -22,8 +22,8 @@ Config file format (games_config.json):
     }
 """
 
-import argparse
 import json
+import logging
 import signal
 import sys
 import time
@@ -38,13 +38,22 @@ if sys.version_info < (3, 10):
     )
     sys.exit(2)
 
-# Import from our new src package
-from src.core.registry import GAMES, load_config
-from src.server.launcher import GameServer
-from src.qa.testing import run_tests
-from src.qa.validation import audit_all
+# The src package is imported lazily inside each branch of main() so that
+# cheap invocations (--help, --list) don't pay for the server, QA and
+# geometry modules they never touch.
+
+DEFAULT_BASE_PORT = 8100
+
+# Argument lists that skip argparse entirely (see _fast_path).
+_LIST_ARGV = (["--list"], ["-l"])
+_VALIDATE_ARGV = (["--validate"], ["-v"])
+_TEST_ARGV = (["--test"], ["-t"])
+
+
+def _build_parser():
+    """Build the full CLI parser (only needed when no fast path matches)."""
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(
         description="QuadCraft Game Launcher — Launch 4D games in your browser",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -59,6 +68,7 @@ Examples:
   python3 run_games.py --config games_config.json       Launch from config file
   python3 run_games.py --test                    Run all unit tests
   python3 run_games.py --test --game doom        Run tests for one game
+  python3 run_games.py --validate --no-cache     Revalidate every game
         """
     )
     parser.add_argument("--game", "-g", nargs="+", metavar="NAME",
@@ -71,40 +81,88 @@ Examples:
                         help="Run unit tests instead of launching")
     parser.add_argument("--validate", "-v", action="store_true",
                         help="Run structural validation on all game directories")
-    parser.add_argument("--base-port", "-p", type=int, default=8100,
-                        help="Base port number (default: 8100)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="With --validate, revalidate every game instead of reusing unchanged results")
+    parser.add_argument("--base-port", "-p", type=int, default=DEFAULT_BASE_PORT,
+                        help=f"Base port number (default: {DEFAULT_BASE_PORT})")
     parser.add_argument("--no-browser", action="store_true",
                         help="Start servers but don't open browser windows")
     parser.add_argument("--config", "-c", metavar="FILE",
                         help="Load game selection from a JSON config file")
+    return parser
+
+
+def _print_list(base_port: int) -> None:
+    """Print the game portfolio table."""
+    from src.core.registry import GAMES
+
+    print("\n🎮 QuadCraft Game Portfolio\n")
+    print(f"  {'Key':18s} {'Name':22s} {'Port':6s} Directory")
+    print(f"  {'─'*18} {'─'*22} {'─'*6} {'─'*20}")
+    wave1 = 0
+    for key, meta in GAMES.items():
+        port = base_port + meta["port_offset"]
+        if meta["port_offset"] < 12:
+            wave1 += 1
+        print(f"  {key:18s} {meta['name']:22s} {port:<6d} {meta['dir']}")
+    print(f"\n  Total: {len(GAMES)} games ({wave1} Wave 1 + {len(GAMES) - wave1} Wave 2)")
+
+
+def _fast_path(argv: list[str], games_dir: Path) -> bool:
+    """Handle bare --list / --validate / --test without building the parser.
+
+    Returns True if the invocation was fully handled.
+    """
+    if argv in _LIST_ARGV:
+        _print_list(DEFAULT_BASE_PORT)
+        return True
+    if argv in _VALIDATE_ARGV:
+        from src.qa.validation import audit_all
+        sys.exit(0 if audit_all(games_dir) else 1)
+    if argv in _TEST_ARGV:
+        from src.qa.testing import run_tests
+        print("\n🧪 Running QuadCraft Unit Tests\n")
+        sys.exit(0 if run_tests(games_dir, None) else 1)
+    return False
 
-    args = parser.parse_args()
+
+def main():
+    # Configured here, at the entry point, rather than by whichever src
+    # module happens to be imported first
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     games_dir = Path(__file__).parent.resolve()
+    if _fast_path(sys.argv[1:], games_dir):
+        return
+
+    parser = _build_parser()
+    args = parser.parse_args()
 
     # ── Validate mode ──
     if args.validate:
-        success = audit_all(games_dir)
+        from src.qa.validation import audit_all
+        success = audit_all(games_dir, use_cache=not args.no_cache)
         sys.exit(0 if success else 1)
 
+    from src.core.registry import GAMES
+
     # ── List mode ──
     if args.list:
-        print("\n🎮 QuadCraft Game Portfolio\n")
-        print(f"  {'Key':18s} {'Name':22s} {'Port':6s} Directory")
-        print(f"  {'─'*18} {'─'*22} {'─'*6} {'─'*20}")
-        for key, meta in GAMES.items():
-            port = args.base_port + meta["port_offset"]
-            print(f"  {key:18s} {meta['name']:22s} {port:<6d} {meta['dir']}")
-        print(f"\n  Total: {len(GAMES)} games ({sum(1 for m in GAMES.values() if m['port_offset'] < 12)} Wave 1 + {sum(1 for m in GAMES.values() if m['port_offset'] >= 12)} Wave 2)")
+        _print_list(args.base_port)
         return
 
     # ── Config file mode ──
     game_keys = None
+    keys_from_registry = False  # True when game_keys came straight from GAMES
     open_browser = not args.no_browser
 
     if args.config:
+        from src.core.registry import load_config
         try:
             config = load_config(args.config)
-            game_keys = config.get("games", list(GAMES.keys()))
+            if "games" in config:
+                game_keys = config["games"]
+            else:
+                game_keys, keys_from_registry = list(GAMES), True
             args.base_port = config.get("base_port", args.base_port)
             if "open_browser" in config:
                 open_browser = config["open_browser"] # Allow config to override CLI default logic
@@ -113,7 +171,7 @@ Examples:
             sys.exit(1)
 
     elif args.all:
-        game_keys = list(GAMES.keys())
+        game_keys, keys_from_registry = list(GAMES), True
     elif args.game:
         game_keys = args.game
 
@@ -122,7 +180,7 @@ Examples:
         return
 
     # ── Validate game keys ──
-    if game_keys:
+    if game_keys and not keys_from_registry:
         invalid = [k for k in game_keys if k not in GAMES]
         if invalid:
             print(f"❌ Unknown game(s): {', '.join(invalid)}")
@@ -131,20 +189,24 @@ Examples:
 
     # ── Test mode ──
     if args.test:
+        from src.qa.testing import run_tests
         print("\n🧪 Running QuadCraft Unit Tests\n")
         success = run_tests(games_dir, game_keys)
         sys.exit(0 if success else 1)
 
     # ── Launch mode ──
+    from src.server.launcher import GameServer, open_urls_batch
     print(f"\n🎮 QuadCraft Launcher — Starting {len(game_keys)} game(s)\n")
 
-    servers = []
-    
-    for key in game_keys:
-        server = GameServer(key, args.base_port, games_dir, open_browser)
-        if server.start():
-            servers.append(server)
-        time.sleep(0.2)  # Stagger browser opens slightly
+    # Bind all servers concurrently, then open their browser tabs in one batch.
+    from concurrent.futures import ThreadPoolExecutor
+
+    candidates = [GameServer(key, args.base_port, games_dir, open_browser, batch_browser=True)
+                  for key in game_keys]
+    with ThreadPoolExecutor(max_workers=min(16, len(candidates))) as pool:
+        started = list(pool.map(GameServer.start, candidates))
+    servers = [s for s, ok in zip(candidates, started) if ok]
+    open_urls_batch()
 
     if not servers:
         print("\n❌ No games could be started")
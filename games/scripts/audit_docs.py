@@ -1,5 +1,7 @@
 
+import functools
 import os
+import sys
 from pathlib import Path
 
 # Directories provided by the user
@@ -16,27 +18,52 @@ TARGET_DIRS = [
 
 # Add all game directories programmatically or explicitly
 GAMES_DIR = Path("games")
-GAME_DIRS = [
-    d for d in GAMES_DIR.iterdir() 
-    if d.is_dir() and d.name.startswith("4d_")
-]
+# DirEntry.is_dir() uses the d_type cached by scandir — no extra stat per entry.
+with os.scandir(GAMES_DIR) as it:
+    GAME_DIRS = [
+        Path(e.path) for e in it
+        if e.is_dir(follow_symlinks=False) and e.name.startswith("4d_")
+    ]
+
+DOC_FILES = ("AGENTS.md", "README.md")
 
 ALL_DIRS = [Path(d) for d in TARGET_DIRS] + GAME_DIRS
 
+@functools.lru_cache(maxsize=256)
 def check_file(path, min_lines=5):
-    if not path.exists():
-        return "MISSING"
+    # Stream lines and stop as soon as min_lines is reached. Leading and
+    # trailing blank lines are ignored, matching content.strip().splitlines().
     try:
-        content = path.read_text(encoding='utf-8')
-        lines = content.strip().splitlines()
-        if len(lines) < min_lines:
-            return f"TOO_SHORT ({len(lines)} lines)"
-        return "OK"
+        count = 0  # lines up to and including the last non-blank one
+        seen = 0   # lines since the first non-blank one
+        with path.open('rb') as f:
+            for line in f:
+                blank = not line.strip()
+                if seen or not blank:
+                    seen += 1
+                    if not blank:
+                        count = seen
+                        if count >= min_lines:
+                            return "OK"
+        return f"TOO_SHORT ({count} lines)"
+    except FileNotFoundError:
+        return "MISSING"
     except Exception as e:
         return f"ERROR ({str(e)})"
 
-print(f"{'DIRECTORY':<40} | {'AGENTS.md':<15} | {'README.md':<15}")
-print("-" * 76)
+def present_docs(d):
+    """Names from DOC_FILES that exist in d, from a single directory listing."""
+    try:
+        with os.scandir(d) as it:
+            return {e.name for e in it if e.name in DOC_FILES}
+    except FileNotFoundError:
+        return set()
+
+# Output is collected and written in one go at the end.
+out = [
+    f"{'DIRECTORY':<40} | {'AGENTS.md':<15} | {'README.md':<15}",
+    "-" * 76,
+]
 
 issues = []
 
@@ -45,22 +72,25 @@ for d in sorted(list(set(ALL_DIRS))): # Deduplicate and sort
     if "__" in d.name or d.name.startswith("."):
         continue
         
-    agents_status = check_file(d / "AGENTS.md")
-    readme_status = check_file(d / "README.md")
+    present = present_docs(d)
+    agents_status = check_file(d / "AGENTS.md") if "AGENTS.md" in present else "MISSING"
+    readme_status = check_file(d / "README.md") if "README.md" in present else "MISSING"
     
     # Special case: src/ subdirs often don't strictly need README if they have AGENTS.md, but user asked for both.
     # We will flag them if missing.
     
-    print(f"{str(d):<40} | {agents_status:<15} | {readme_status:<15}")
+    out.append(f"{str(d):<40} | {agents_status:<15} | {readme_status:<15}")
     
     if "MISSING" in agents_status or "TOO_SHORT" in agents_status:
         issues.append((d, "AGENTS.md", agents_status))
     if "MISSING" in readme_status or "TOO_SHORT" in readme_status:
         issues.append((d, "README.md", readme_status))
 
-print("\n=== Issues Found ===")
+out.append("\n=== Issues Found ===")
 if not issues:
-    print("None. All directories have valid documentation.")
+    out.append("None. All directories have valid documentation.")
 else:
     for d, f, s in issues:
-        print(f"{d}/{f}: {s}")
+        out.append(f"{d}/{f}: {s}")
+
+sys.stdout.write("\n".join(out) + "\n")
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os
+import string
 import sys
 from pathlib import Path
 
@@ -10,17 +11,17 @@ if game_root not in sys.path:
 
 from src.core.registry import GAMES
 
-# Standard AGENTS.md template
-TEMPLATE = """# {name}
+# Standard AGENTS.md template (parsed once at import)
+TEMPLATE = string.Template("""# ${name}
 
 ## 🤖 Game Overview
-**{name}** is a 4D browser game built on the QuadCraft engine. It runs in the browser using [Quadray coordinates](../../docs/mathematics/quadray_coordinates.md) for 4D spatial logic.
+**${name}** is a 4D browser game built on the QuadCraft engine. It runs in the browser using [Quadray coordinates](../../docs/mathematics/quadray_coordinates.md) for 4D spatial logic.
 
 ## 📂 Architecture
 - **Entry Point**: `index.html` (Loads shared modules + game scripts)
-- **Logic**: `{dir}/js/{key}_board.js` (State management)
-- **Rendering**: `{dir}/js/{key}_renderer.js` (Canvas drawing)
-- **Control**: `{dir}/js/{key}_game.js` (Input & Game Loop)
+- **Logic**: `${dir}/js/${key}_board.js` (State management)
+- **Rendering**: `${dir}/js/${key}_renderer.js` (Canvas drawing)
+- **Control**: `${dir}/js/${key}_game.js` (Input & Game Loop)
 
 > **Note**: Legacy games (Wave 1) might use `board.js`, `renderer.js`, `game.js`.
 
@@ -36,35 +37,35 @@ This game imports core libraries from `../4d_generic/`:
 ### Running Locally
 Use the Python launcher to ensure correct module loading (do not just open HTML file if checking headers/imports):
 ```bash
-python3 ../../run_games.py --game {key}
+python3 ../../run_games.py --game ${key}
 ```
 
 ### 🧪 Testing
 Run unit tests for this game:
 ```bash
-python3 ../../run_games.py --test --game {key}
+python3 ../../run_games.py --test --game ${key}
 ```
-"""
+""")
 
 def main():
     # games/scripts/ -> games/
     games_root = Path(__file__).parent.parent
 
-    for key, meta in GAMES.items():
-        dir_name = meta["dir"]
-        agents_md_path = games_root / dir_name / "AGENTS.md"
-        
-        if not agents_md_path.exists():
-            print(f"Creating missing AGENTS.md for {meta['name']}...")
-            content = TEMPLATE.format(
-                name=meta["name"], 
-                key=key,
-                dir=dir_name
-            )
-            with open(agents_md_path, "w") as f:
+    targets = [
+        (meta["name"], games_root / meta["dir"] / "AGENTS.md",
+         TEMPLATE.substitute(name=meta["name"], key=key, dir=meta["dir"]))
+        for key, meta in GAMES.items()
+    ]
+
+    for name, agents_md_path, content in targets:
+        # Exclusive-create mode: existing files are detected by the open() itself.
+        try:
+            with open(agents_md_path, "x") as f:
                 f.write(content)
+        except FileExistsError:
+            print(f"✅ Found AGENTS.md for {name}")
         else:
-            print(f"✅ Found AGENTS.md for {meta['name']}")
+            print(f"Creating missing AGENTS.md for {name}...")
 
 if __name__ == "__main__":
     main()
@@ -68,11 +68,14 @@ INFRA_DIRS = {
 }
 
 def create_file(path, content):
-    if not path.exists():
-        print(f"Creating {path}...")
-        path.write_text(content, encoding='utf-8')
-    else:
+    # Exclusive-create mode: one open() call both checks and creates.
+    try:
+        with path.open('x', encoding='utf-8') as f:
+            f.write(content)
+    except FileExistsError:
         print(f"Skipping {path} (already exists)")
+    else:
+        print(f"Creating {path}...")
 
 # 1. Fix Game READMEs
 for game_dir in MISSING_GAMES_README:
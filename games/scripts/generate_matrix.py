@@ -1,3 +1,6 @@
+import os
+import pickle
+import re
 import sys
 sys.path.append('.')
 from src.core.registry import GAMES
@@ -11,7 +14,34 @@ modules = [
     ("base_board.js", "bb"), ("entity_system.js", "es"), ("turn_manager.js", "tm"), ("pathfinding.js", "pf")
 ]
 
+# One pass per HTML file instead of a substring scan per module.
+# Longest names first so a name that prefixes another cannot shadow it.
+MODULE_RE = re.compile('|'.join(
+    re.escape(m) for m in sorted((m for m, _ in modules), key=len, reverse=True)
+))
+
 games_dir = Path.cwd()
+
+# index.html contents from previous runs, keyed by path and validated by mtime.
+CACHE_PATH = games_dir / ".cache" / "matrix_html.pkl"
+try:
+    with open(CACHE_PATH, "rb") as f:
+        html_cache = pickle.load(f)
+except (OSError, pickle.UnpicklingError, EOFError):
+    html_cache = {}
+cache_dirty = False
+
+def read_html(path):
+    global cache_dirty
+    mtime = os.stat(path).st_mtime_ns
+    cached = html_cache.get(str(path))
+    if cached and cached[0] == mtime:
+        return cached[1]
+    text = path.read_text(encoding="utf-8", errors="replace")
+    html_cache[str(path)] = (mtime, text)
+    cache_dirty = True
+    return text
+
 print("| Game | " + " | ".join([abbr for _, abbr in modules]) + " |")
 print("|------|" + "|".join(["----" for _ in modules]) + "|")
 
@@ -19,10 +49,15 @@ for key, meta in GAMES.items():
     name = meta["name"].replace("4D ", "")
     html_path = games_dir / meta["dir"] / "index.html"
     if not html_path.exists(): continue
-    html = html_path.read_text()
+    found = set(MODULE_RE.findall(read_html(html_path)))
     
     row = f"| {name} | "
     for mod, abbr in modules:
-        used = "●" if f'"{mod}"' in html or f"'{mod}'" in html or mod in html else ("—" if abbr in ("bb","es","tm","pf") else "—")
+        used = "●" if mod in found else "—"
         row += f"{used} | "
     print(row)
+
+if cache_dirty:
+    CACHE_PATH.parent.mkdir(exist_ok=True)
+    with open(CACHE_PATH, "wb") as f:
+        pickle.dump(html_cache, f)
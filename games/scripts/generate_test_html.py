@@ -144,8 +144,8 @@ TEST_CONFIG = {
 }
 
 def main():
-    # games/scripts/ -> games/
-    games_root = Path(__file__).parent.parent
+    # games/scripts/ -> games/ (resolved once; per-game paths are plain strings)
+    games_root = os.fspath(Path(__file__).resolve().parent.parent)
     
     for key, meta in GAMES.items():
         dir_name = meta["dir"]
@@ -155,7 +155,7 @@ def main():
             
         config = TEST_CONFIG[dir_name]
         
-        test_html_path = games_root / dir_name / "tests/test.html"
+        test_html_path = f"{games_root}/{dir_name}/tests/test.html"
         
         # Determine script type
         script_type = 'type="module"' if config.get("is_module") else ''
@@ -170,8 +170,7 @@ def main():
         )
         
         print(f"Updating {test_html_path}...")
-        with open(test_html_path, "w") as f:
-            f.write(content)
+        Path(test_html_path).write_text(content, encoding="utf-8")
 
 if __name__ == "__main__":
     main()
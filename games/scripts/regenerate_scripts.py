@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -14,6 +15,9 @@ TEMPLATE_FILE = "games/scripts/_run_template.sh"
 
 BASE_PORT = 8100
 
+# All template placeholders, substituted in a single pass per game.
+PLACEHOLDER_RE = re.compile(r'GAMENAME|DISPLAYNAME|GAMEDIR|DEFAULTPORT')
+
 def main():
     if not os.path.exists(TEMPLATE_FILE):
         print(f"❌ Template file not found: {TEMPLATE_FILE}")
@@ -24,14 +28,16 @@ def main():
 
     for key, meta in GAMES.items():
         port = BASE_PORT + meta["port_offset"]
-        content = template.replace("GAMENAME", key) \
-                          .replace("DISPLAYNAME", meta["name"]) \
-                          .replace("GAMEDIR", meta["dir"]) \
-                          .replace("DEFAULTPORT", str(port))
+        values = {
+            "GAMENAME": key,
+            "DISPLAYNAME": meta["name"],
+            "GAMEDIR": meta["dir"],
+            "DEFAULTPORT": str(port),
+        }
+        content = PLACEHOLDER_RE.sub(lambda m: values[m.group(0)], template)
         
         filename = f"games/run_{key}.sh"
-        with open(filename, "w") as f:
-            f.write(content)
+        Path(filename).write_text(content)
         
         os.chmod(filename, 0o755)
         print(f"✅ Generated {filename}")
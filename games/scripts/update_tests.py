@@ -24,10 +24,18 @@ TEST_COUNTS = {
     '4d_lights_out': 45
 }
 
+# Compiled once; only the replacement strings vary per game.
+# "(X tests)"
+PAT_PARENS = re.compile(r'\(\d+ tests\)')
+# Markdown table rows like "| `test_*.js` | 8 |" or "| test_all.js | 8 |"
+PAT_TABLE = re.compile(r'(\|\s*`?test_[a-z0-9_]+\.js`?\s*\|\s*)\d+(\s*\|)')
+
 def update_test_counts():
     games_dir = '/Users/4d/Documents/GitHub/QuadCraft/games'
     
     for game, count in TEST_COUNTS.items():
+        parens_repl = f'({count} tests)'
+        table_repl = fr'\g<1>{count}\g<2>'
         agents_md_path = os.path.join(games_dir, game, 'AGENTS.md')
         
         if not os.path.exists(agents_md_path):
@@ -42,10 +50,12 @@ def update_test_counts():
         # Be careful, typical formats: "Test suite (8 tests)", "| `test_asteroids.js` | 8 |", "8 tests"
         
         # Replace "(X tests)"
-        content = re.sub(r'\(\d+ tests\)', f'({count} tests)', content)
+        if 'tests)' in content:
+            content = PAT_PARENS.sub(parens_repl, content)
         
         # Replace the markdown table rows like "| `test_*.js` | 8 |" or "| test_all.js | 8 |"
-        content = re.sub(r'(\|\s*`?test_[a-z0-9_]+\.js`?\s*\|\s*)\d+(\s*\|)', fr'\g<1>{count}\g<2>', content)
+        if 'test_' in content:
+            content = PAT_TABLE.sub(table_repl, content)
         
         # Wait, for games like 4d_chess there are multiple files, but it's not in the list.
         # So it's safe to just replace digits in the test table where the column is clearly tests.
@@ -61,7 +71,8 @@ def update_test_counts():
             with open(readme_md_path, 'r') as f:
                 r_content = f.read()
             original_r_content = r_content
-            r_content = re.sub(r'\(\d+ tests\)', f'({count} tests)', r_content)
+            if 'tests)' in r_content:
+                r_content = PAT_PARENS.sub(parens_repl, r_content)
             if r_content != original_r_content:
                 with open(readme_md_path, 'w') as f:
                     f.write(r_content)
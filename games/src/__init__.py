@@ -10,36 +10,73 @@ from .core.config import (
     REPO_ROOT, GAMES_DIR, GENERIC_DIR, SHARED_DIR_NAME,
     BASE_PORT, SHARED_MODULES, OPTIONAL_SHARED_MODULES,
     ALL_SHARED_MODULES, REQUIRED_FILES,
-    REQUIRED_JS_PATTERNS, LOG_PREFIX,
-)
-from .core.registry import GAMES, load_config, get_port
-from .server.launcher import GameServer
-from .qa.testing import run_tests
-from .qa.validation import validate_game, audit_all
-from .scaffold import GameScaffold
-from .analytics import GameAnalytics, SuiteReport, GameMetrics
-from .shared import ModuleRegistry, JSModule, resolve_module_path
-from .board import BoardAudit, AuditResult, BoardCatalog, BoardInfo
-from .space import (
-    Quadray, IVM, SYNERGETICS,
-    quadray_to_xyz, xyz_to_quadray,
-    project_quadray, rotate_xyz, ScreenPoint, project_basis_axes,
-    IVMGrid, Jitterbug,
-    angle_between, distance, manhattan_4d, euclidean_4d,
-    verify_round_trip, verify_geometric_identities,
-    CheckResult, VerificationReport,
-    generate_grid, neighbors, bounded_neighbors,
-    in_bounds, depth_sort, random_coord,
+    REQUIRED_JS_PATTERNS, SCAN_WORKERS, TEST_WORKERS, LOG_PREFIX,
 )
+from .core.registry import GAMES, GAME_META, GameMeta, load_config, get_port
+
+# Everything below the registry is resolved lazily via __getattr__ so that
+# importing a light submodule (e.g. src.core.registry) doesn't drag in the
+# HTTP server, QA runners, scaffold templates or the geometry package.
+_LAZY_ATTRS = {
+    # Launcher
+    "GameServer": ".server.launcher",
+    # Testing
+    "run_tests": ".qa.testing",
+    # Validation
+    "validate_game": ".qa.validation", "audit_all": ".qa.validation",
+    # Scaffold
+    "GameScaffold": ".scaffold", "create_many": ".scaffold",
+    # Analytics
+    "GameAnalytics": ".analytics", "SuiteReport": ".analytics",
+    "GameMetrics": ".analytics",
+    # Shared module registry
+    "ModuleRegistry": ".shared", "JSModule": ".shared",
+    "resolve_module_path": ".shared",
+    # Board tools
+    "BoardAudit": ".board", "AuditResult": ".board",
+    "BoardCatalog": ".board", "BoardInfo": ".board",
+    # Space — Quadray / IVM / XYZ / Geometry
+    **{name: ".space" for name in (
+        "Quadray", "QuadrayArray", "IVM", "SYNERGETICS",
+        "quadray_to_xyz", "xyz_to_quadray",
+        "project_quadray", "rotate_xyz", "ScreenPoint", "project_basis_axes",
+        "project_quadray_batch", "rotate_xyz_batch",
+        "IVMGrid", "Jitterbug",
+        "volume_xyz_to_ivm", "volume_ivm_to_xyz",
+        "volume_xyz_to_ivm_batch", "volume_ivm_to_xyz_batch",
+        "angle_between", "distance", "manhattan_4d", "euclidean_4d",
+        "verify_round_trip", "verify_geometric_identities",
+        "CheckResult", "VerificationReport",
+        "generate_grid", "generate_grid_array", "iter_grid", "iter_grid_coords",
+        "neighbors", "bounded_neighbors",
+        "neighbors_array", "bounded_neighbors_array", "bounded_neighbor_indices",
+        "in_bounds", "depth_sort", "depth_sort_array", "DepthOrder", "random_coord",
+    )},
+}
+
+
+def __getattr__(name: str):
+    """Import lazily-exported names on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     # Config
     "REPO_ROOT", "GAMES_DIR", "GENERIC_DIR", "SHARED_DIR_NAME",
     "BASE_PORT", "SHARED_MODULES", "OPTIONAL_SHARED_MODULES",
     "ALL_SHARED_MODULES", "REQUIRED_FILES",
-    "REQUIRED_JS_PATTERNS", "LOG_PREFIX",
+    "REQUIRED_JS_PATTERNS", "SCAN_WORKERS", "TEST_WORKERS", "LOG_PREFIX",
     # Registry
-    "GAMES", "load_config", "get_port",
+    "GAMES", "GAME_META", "GameMeta", "load_config", "get_port",
     # Launcher
     "GameServer",
     # Testing
@@ -47,7 +84,7 @@ __all__ = [
     # Validation
     "validate_game", "audit_all",
     # Scaffold
-    "GameScaffold",
+    "GameScaffold", "create_many",
     # Analytics
     "GameAnalytics", "SuiteReport", "GameMetrics",
     # Shared module registry
@@ -55,14 +92,19 @@ __all__ = [
     # Board tools
     "BoardAudit", "AuditResult", "BoardCatalog", "BoardInfo",
     # Space — Quadray / IVM / XYZ
-    "Quadray", "IVM", "SYNERGETICS",
+    "Quadray", "QuadrayArray", "IVM", "SYNERGETICS",
     "quadray_to_xyz", "xyz_to_quadray",
     "project_quadray", "rotate_xyz", "ScreenPoint", "project_basis_axes",
+    "project_quadray_batch", "rotate_xyz_batch",
     "IVMGrid", "Jitterbug",
+    "volume_xyz_to_ivm", "volume_ivm_to_xyz",
+    "volume_xyz_to_ivm_batch", "volume_ivm_to_xyz_batch",
     # Space — Geometry
     "angle_between", "distance", "manhattan_4d", "euclidean_4d",
     "verify_round_trip", "verify_geometric_identities",
     "CheckResult", "VerificationReport",
-    "generate_grid", "neighbors", "bounded_neighbors",
-    "in_bounds", "depth_sort", "random_coord",
+    "generate_grid", "generate_grid_array", "iter_grid", "iter_grid_coords",
+    "neighbors", "bounded_neighbors",
+    "neighbors_array", "bounded_neighbors_array", "bounded_neighbor_indices",
+    "in_bounds", "depth_sort", "depth_sort_array", "DepthOrder", "random_coord",
 ]
@@ -15,14 +15,31 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from ..core.config import GAMES_DIR, GENERIC_DIR, SHARED_MODULES, ALL_SHARED_MODULES, REQUIRED_FILES
+from ..core.config import (
+    GAMES_DIR, GENERIC_DIR, SHARED_MODULES, ALL_SHARED_MODULES, REQUIRED_FILES, SCAN_WORKERS,
+)
+from ..core.discovery import list_game_dirs
 
 logger = logging.getLogger(__name__)
 
+# Single-pass feature scan over JS sources. "GameLoop" is tried before the
+# bare "Game" so it isn't shadowed; a GameLoop hit also counts as "Game".
+_SIGNAL_RE = re.compile(
+    r"(?P<loop>GameLoop|requestAnimationFrame)"
+    r"|(?P<board>Board)"
+    r"|(?P<renderer>Renderer)"
+    r"|(?P<game>Game)"
+    r"|(?P<cls>class )"
+    r"|(?P<input>InputController|addEventListener\('keydown')"
+)
+_SIGNAL_GROUPS = frozenset(_SIGNAL_RE.groupindex)
+
 
 # ─── Data Classes ────────────────────────────────────────────────────────────
 
@@ -43,9 +60,13 @@ class GameMetrics:
     missing_files: List[str] = field(default_factory=list)
     issues: List[str] = field(default_factory=list)
 
-    @property
+    @cached_property
     def health_score(self) -> float:
-        """0.0–1.0 health score based on completeness."""
+        """0.0–1.0 health score based on completeness.
+
+        Computed once on first access; read it only after the scan has
+        filled in the fields above.
+        """
         checks = [
             self.has_board,
             self.has_renderer,
@@ -82,31 +103,36 @@ class SuiteReport:
             "─" * 55,
         ]
         for g in sorted(self.games, key=lambda x: x.key):
-            health_pct = f"{g.health_score * 100:.0f}%"
-            icon = "✅" if g.health_score >= 0.85 else "⚠️" if g.health_score >= 0.5 else "❌"
+            score = g.health_score
+            health_pct = f"{score * 100:.0f}%"
+            icon = "✅" if score >= 0.85 else "⚠️" if score >= 0.5 else "❌"
             lines.append(
                 f"{icon} {g.key:<23s} {health_pct:>6s} {g.js_files:>4d} {g.total_js_lines:>6d} {len(g.issues):>7d}"
             )
         return '\n'.join(lines)
 
-    def to_json(self) -> str:
-        """Serialize to JSON."""
-        return json.dumps({
+    def to_json(self, compact: bool = False) -> str:
+        """Serialize to JSON. `compact` drops indentation and spacing."""
+        games = [
+            {
+                "key": g.key,
+                "health": round(g.health_score, 3),
+                "js_files": g.js_files,
+                "js_lines": g.total_js_lines,
+                "issues": g.issues,
+            }
+            for g in self.games
+        ]
+        data = {
             "game_count": len(self.games),
             "shared_modules": self.shared_module_count,
             "total_js_files": self.total_js_files,
             "total_js_lines": self.total_js_lines,
-            "games": [
-                {
-                    "key": g.key,
-                    "health": round(g.health_score, 3),
-                    "js_files": g.js_files,
-                    "js_lines": g.total_js_lines,
-                    "issues": g.issues,
-                }
-                for g in self.games
-            ],
-        }, indent=2)
+            "games": games,
+        }
+        if compact:
+            return json.dumps(data, separators=(',', ':'))
+        return json.dumps(data, indent=2)
 
 
 # ─── Analytics Engine ────────────────────────────────────────────────────────
@@ -124,40 +150,57 @@ class GameAnalytics:
         key = game_dir.name.replace("4d_", "")
         m = GameMetrics(key=key, name=key.replace("_", " ").title(), dir_path=str(game_dir))
 
+        # One listing of the game directory answers every existence check below
+        try:
+            with os.scandir(game_dir) as it:
+                names = {e.name for e in it}
+        except (FileNotFoundError, NotADirectoryError):
+            names = set()
+
         # Check required files
         for f in REQUIRED_FILES:
-            if not (game_dir / f).exists():
+            if f not in names:
                 m.missing_files.append(f)
                 m.issues.append(f"Missing: {f}")
 
         # Scan JS files
-        js_dir = game_dir / "js"
-        if js_dir.is_dir():
-            for js_file in js_dir.glob("*.js"):
-                m.js_files += 1
-                try:
-                    lines = js_file.read_text().splitlines()
-                    m.total_js_lines += len(lines)
-                    content = js_file.read_text()
-
-                    if "Board" in content and "class " in content:
-                        m.has_board = True
-                    if "Renderer" in content and "class " in content:
-                        m.has_renderer = True
-                    if "class " in content and "Game" in content:
-                        m.has_game_controller = True
-                    if "GameLoop" in content or "requestAnimationFrame" in content:
-                        m.has_game_loop = True
-                    if "InputController" in content or "addEventListener('keydown'" in content:
-                        m.has_input_controller = True
-                except Exception as e:
-                    m.issues.append(f"Error reading {js_file.name}: {e}")
+        try:
+            with os.scandir(game_dir / "js") as it:
+                js_entries = [e for e in it
+                              if e.name.endswith(".js") and not e.name.startswith(".") and e.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            js_entries = []
+
+        for js_file in js_entries:
+            m.js_files += 1
+            try:
+                with open(js_file.path, encoding='utf-8', errors='replace') as f:
+                    content = f.read()
+                # Count newlines in C rather than materialising a list of lines
+                m.total_js_lines += content.count('\n') + (bool(content) and not content.endswith('\n'))
+
+                seen = set()
+                for match in _SIGNAL_RE.finditer(content):
+                    seen.add(match.lastgroup)
+                    if match.group() == "GameLoop":
+                        seen.add("game")
+                    if len(seen) == len(_SIGNAL_GROUPS):
+                        break
+
+                if "cls" in seen:
+                    m.has_board |= "board" in seen
+                    m.has_renderer |= "renderer" in seen
+                    m.has_game_controller |= "game" in seen
+                m.has_game_loop |= "loop" in seen
+                m.has_input_controller |= "input" in seen
+            except Exception as e:
+                m.issues.append(f"Error reading {js_file.name}: {e}")
 
         # Check HTML for shared module imports
         index_html = game_dir / "index.html"
-        if index_html.exists():
+        if "index.html" in names:
             try:
-                html_content = index_html.read_text()
+                html_content = index_html.read_text(encoding="utf-8", errors="replace")
                 for mod in SHARED_MODULES:
                     if mod in html_content:
                         m.shared_modules_used.append(mod)
@@ -184,12 +227,12 @@ class GameAnalytics:
             )
 
         # Scan each 4d_* directory
-        for d in sorted(self.games_dir.iterdir()):
-            if d.is_dir() and d.name.startswith("4d_") and d.name != "4d_generic":
-                metrics = self.scan_game(d)
-                report.games.append(metrics)
-                report.total_js_files += metrics.js_files
-                report.total_js_lines += metrics.total_js_lines
+        # Games are independent and I/O-bound; map() keeps the sorted order.
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            report.games = list(pool.map(self.scan_game, list_game_dirs(self.games_dir)))
+        for metrics in report.games:
+            report.total_js_files += metrics.js_files
+            report.total_js_lines += metrics.total_js_lines
 
         logger.info("[Analytics] Full report: %d games scanned", len(report.games))
         return report
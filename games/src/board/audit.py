@@ -7,9 +7,12 @@ duplicate shared methods locally. Useful for tracking migration progress.
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import NamedTuple
-from ..core.config import GAMES_DIR
+from ..core.config import GAMES_DIR, SCAN_WORKERS
+from ..core.discovery import list_game_dirs
+from .common import compile_pattern, read_board
 
 
 class AuditResult(NamedTuple):
@@ -35,6 +38,12 @@ SHARED_METHODS = [
     'inBounds(',
 ]
 
+# Indented definitions of any SHARED_METHODS entry, found in one scan
+_SHARED_METHOD_RE = compile_pattern(
+    r'^\s+(' + '|'.join(re.escape(m) for m in SHARED_METHODS) + ')',
+    re.MULTILINE,
+)
+
 # The require preamble pattern
 REQUIRE_PREAMBLE = re.compile(
     r"if\s*\(\s*typeof\s+(Quadray|GridUtils|SYNERGETICS)\s*===\s*'undefined'"
@@ -52,15 +61,18 @@ class BoardAudit:
     def scan_game(self, game_dir: Path) -> AuditResult | None:
         """Check if a game's board file extends BaseBoard or duplicates methods."""
         js_dir = game_dir / 'js'
-        if not js_dir.is_dir():
+        try:
+            with os.scandir(js_dir) as it:
+                board_names = [e.name for e in it
+                               if e.name.endswith('_board.js') and not e.name.startswith('.')]
+        except (FileNotFoundError, NotADirectoryError):
             return None
-
-        board_files = list(js_dir.glob('*_board.js'))
-        if not board_files:
+        if not board_names:
             return None
 
-        board_file = board_files[0]
-        content = board_file.read_text(encoding='utf-8', errors='replace')
+        # Directory order is arbitrary; pick deterministically (same as BoardCatalog)
+        board_file = js_dir / min(board_names)
+        content = read_board(board_file)
 
         # Check for extends BaseBoard
         extends = bool(re.search(r'class\s+\w+\s+extends\s+BaseBoard', content))
@@ -69,12 +81,9 @@ class BoardAudit:
         has_local_require = bool(REQUIRE_PREAMBLE.search(content))
 
         # Find locally-defined shared methods
-        local_methods = []
-        for method_sig in SHARED_METHODS:
-            # Match method definition (not just usage)
-            pattern = re.escape(method_sig)
-            if re.search(rf'^\s+{pattern}', content, re.MULTILINE):
-                local_methods.append(method_sig.rstrip('('))
+        # Match method definition (not just usage); report in SHARED_METHODS order
+        hits = {m.group(1) for m in _SHARED_METHOD_RE.finditer(content)}
+        local_methods = [sig.rstrip('(') for sig in SHARED_METHODS if sig in hits]
 
         game_key = game_dir.name.replace('4d_', '')
 
@@ -88,16 +97,10 @@ class BoardAudit:
 
     def scan_all(self) -> list[AuditResult]:
         """Scan all game directories for migration status."""
-        results = []
-        for d in sorted(self.games_dir.iterdir()):
-            if not d.is_dir() or not d.name.startswith('4d_'):
-                continue
-            if d.name == '4d_generic':
-                continue  # shared modules, not a game
-            result = self.scan_game(d)
-            if result:
-                results.append(result)
-        return results
+        # Games are independent and I/O-bound; map() keeps the sorted order.
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            scanned = pool.map(self.scan_game, list_game_dirs(self.games_dir))
+            return [r for r in scanned if r]
 
     def migration_report(self) -> str:
         """Generate a markdown report of migration status."""
@@ -8,9 +8,13 @@ method inventories. Useful for identifying further extraction opportunities.
 
 import os
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import NamedTuple
-from ..core.config import GAMES_DIR
+from ..core.config import GAMES_DIR, SCAN_WORKERS
+from ..core.discovery import list_game_dirs
+from .common import compile_pattern, read_board
 
 
 class BoardInfo(NamedTuple):
@@ -31,6 +35,17 @@ TURN_BASED_SIGNALS = ['currentPlayer', 'getValidMoves', 'executeMove', 'place(']
 REAL_TIME_SIGNALS = ['step(', 'vel', 'distTo', 'collidesWith', 'update(dt']
 SANDBOX_SIGNALS = ['seedRandom', 'generation', 'countNeighbors']
 
+# All signals in one alternation; group name → (signal, category).
+_SIGNALS = (
+    [(s, 'turn') for s in TURN_BASED_SIGNALS]
+    + [(s, 'rt') for s in REAL_TIME_SIGNALS]
+    + [(s, 'sb') for s in SANDBOX_SIGNALS]
+)
+_SIGNAL_RE = compile_pattern('|'.join(
+    f'(?P<s{i}>{re.escape(sig)})' for i, (sig, _) in enumerate(_SIGNALS)
+))
+_SIGNAL_CATEGORY = {f's{i}': cat for i, (_, cat) in enumerate(_SIGNALS)}
+
 
 class BoardCatalog:
     """Catalog all game board JS files in the games directory."""
@@ -42,9 +57,16 @@ class BoardCatalog:
 
     def _detect_pattern(self, content: str) -> str:
         """Heuristically detect whether a game is turn-based, real-time, or sandbox."""
-        turn_hits = sum(1 for s in TURN_BASED_SIGNALS if s in content)
-        rt_hits = sum(1 for s in REAL_TIME_SIGNALS if s in content)
-        sb_hits = sum(1 for s in SANDBOX_SIGNALS if s in content)
+        # Each signal counts once, however often it occurs.
+        seen = set()
+        for match in _SIGNAL_RE.finditer(content):
+            seen.add(match.lastgroup)
+            if len(seen) == len(_SIGNALS):
+                break
+        hits = {'turn': 0, 'rt': 0, 'sb': 0}
+        for group in seen:
+            hits[_SIGNAL_CATEGORY[group]] += 1
+        turn_hits, rt_hits, sb_hits = hits['turn'], hits['rt'], hits['sb']
 
         if sb_hits >= 2:
             return 'sandbox'
@@ -80,16 +102,18 @@ class BoardCatalog:
     def scan_game(self, game_dir: Path) -> BoardInfo | None:
         """Parse a game's board file and return structured info."""
         js_dir = game_dir / 'js'
-        if not js_dir.is_dir():
+        try:
+            with os.scandir(js_dir) as it:
+                board_names = [e.name for e in it
+                               if e.name.endswith('_board.js') and not e.name.startswith('.')]
+        except (FileNotFoundError, NotADirectoryError):
             return None
-
-        board_files = list(js_dir.glob('*_board.js')) + list(js_dir.glob('td_board.js'))
-        board_files = list(set(board_files))
-        if not board_files:
+        if not board_names:
             return None
 
-        board_file = board_files[0]
-        content = board_file.read_text(encoding='utf-8', errors='replace')
+        # Directory order is arbitrary; pick deterministically (same as BoardAudit)
+        board_file = js_dir / min(board_names)
+        content = read_board(board_file)
         line_count = content.count('\n') + 1
 
         class_name = self._extract_class_name(content)
@@ -115,31 +139,28 @@ class BoardCatalog:
 
     def scan_all(self) -> list[BoardInfo]:
         """Scan all game directories."""
-        results = []
-        for d in sorted(self.games_dir.iterdir()):
-            if not d.is_dir() or not d.name.startswith('4d_'):
-                continue
-            if d.name == '4d_generic':
-                continue
-            result = self.scan_game(d)
-            if result:
-                results.append(result)
-        return results
-
-    def find_shared_methods(self, min_count: int = 3) -> dict[str, list[str]]:
+        # Games are independent and I/O-bound; map() keeps the sorted order.
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            scanned = pool.map(self.scan_game, list_game_dirs(self.games_dir))
+            return [r for r in scanned if r]
+
+    def find_shared_methods(self, min_count: int = 3,
+                            results: list[BoardInfo] | None = None) -> dict[str, list[str]]:
         """Identify methods that appear in min_count+ board files.
+        Pass `results` from an earlier scan_all() to avoid rescanning.
         Returns { method_name: [game_keys] }.
         """
-        results = self.scan_all()
-        method_games: dict[str, list[str]] = {}
+        if results is None:
+            results = self.scan_all()
+        method_games: dict[str, list[str]] = defaultdict(list)
         for r in results:
             for m in r.methods:
-                method_games.setdefault(m, []).append(r.game_key)
+                method_games[m].append(r.game_key)
 
-        return {
-            m: games for m, games in sorted(method_games.items(), key=lambda x: -len(x[1]))
-            if len(games) >= min_count
-        }
+        # Filter before sorting so only the qualifying methods are ordered
+        shared = [(m, games) for m, games in method_games.items() if len(games) >= min_count]
+        shared.sort(key=lambda x: -len(x[1]))
+        return dict(shared)
 
     def summary_report(self) -> str:
         """Generate a markdown summary of all board classes."""
@@ -179,7 +200,7 @@ class BoardCatalog:
         lines.append("")
 
         # Shared methods
-        shared = self.find_shared_methods(3)
+        shared = self.find_shared_methods(3, results)
         if shared:
             lines.append("## Shared Methods (3+ games)")
             lines.append("")
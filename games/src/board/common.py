@@ -0,0 +1,73 @@
+"""
+games.src.board.common — Helpers shared by the board audit and catalog tools.
+
+BoardAudit and BoardCatalog read the same *_board.js files; routing both
+through read_board() means a combined audit + catalog run decodes each
+file only once.
+
+compile_pattern() uses google-re2 (linear-time DFA matching) for the large
+multi-signal alternations when it is installed, and stdlib re otherwise.
+"""
+
+import logging
+import mmap
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+# re flags compile_pattern() can express for re2: MULTILINE becomes an
+# inline (?m), the others map onto re2.Options.  re.UNICODE is implied for
+# str patterns in both engines.
+_RE2_FLAGS = re.MULTILINE | re.IGNORECASE | re.DOTALL | re.UNICODE
+
+
+def compile_pattern(pattern: str, flags: int = 0):
+    """Compile with re2 when available, falling back to re.
+
+    Only use for patterns whose matches are consumed through the common
+    subset of both engines (search/finditer, group(), lastgroup).
+    """
+    if re2 is not None:
+        if flags & ~_RE2_FLAGS:
+            logger.debug("compile_pattern: flags %r unsupported by re2, using re", flags)
+        else:
+            options = re2.Options()
+            options.case_sensitive = not flags & re.IGNORECASE
+            options.dot_nl = bool(flags & re.DOTALL)
+            options.log_errors = False  # rejections are logged below instead
+            re2_pattern = "(?m)" + pattern if flags & re.MULTILINE else pattern
+            try:
+                return re2.compile(re2_pattern, options)
+            except re2.error as e:
+                logger.debug("compile_pattern: re2 rejected %r (%s), using re", pattern, e)
+    return re.compile(pattern, flags)
+
+
+# Files at least this large are decoded straight from an mmap, skipping the
+# intermediate bytes copy that read() would allocate.
+MMAP_THRESHOLD = 64 * 1024
+
+
+@lru_cache(maxsize=256)
+def _read_board_cached(path: str, mtime_ns: int, size: int) -> str:
+    if size < MMAP_THRESHOLD:
+        return Path(path).read_text(encoding='utf-8', errors='replace')
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = str(mm, 'utf-8', 'replace')
+    if '\r' in text:  # match text-mode universal newlines
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def read_board(path: str | Path) -> str:
+    """Return a board file's text, cached until the file changes on disk."""
+    st = os.stat(path)
+    return _read_board_cached(os.fspath(path), st.st_mtime_ns, st.st_size)
@@ -11,12 +11,12 @@ Usage:
   python3 -m games.src.board.migrate           # Dry-run
   python3 -m games.src.board.migrate --apply   # Apply
 """
+import os
 import re
 import sys
 import logging
 from pathlib import Path
 
-logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
 GAMES_DIR = Path(__file__).parent.parent
@@ -29,19 +29,44 @@ SUPER_CALL_OVERRIDES = {
     "CatanBoard": "6, { name: 'CatanBoard', verify: false }",
 }
 
+# Patterns used on every board, compiled once
+_CLASS_RE = re.compile(r'class (\w+Board)\s*\{')
+_CLASS_DECL_RE = re.compile(r'\nclass \w+Board')
+_CTOR_RE = re.compile(r'constructor\(([^)]*)\)\s*\{')
+_GRIDUTILS_REQUIRE_RE = re.compile(r"if \(typeof GridUtils === 'undefined'")
 
-def add_baseboard_script(html_path: Path, dry_run: bool) -> bool:
+
+def _write(path: Path, content: str, pending: dict | None) -> None:
+    """Write now, or stage into `pending` for a later flush_writes()."""
+    if pending is None:
+        path.write_text(content, encoding="utf-8")
+    else:
+        pending[path] = content
+
+
+def flush_writes(pending: dict) -> None:
+    """Write staged contents, each atomically via a sibling temp file."""
+    for path, content in pending.items():
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, path)
+    pending.clear()
+
+
+def add_baseboard_script(html_path: Path, dry_run: bool, pending: dict | None = None) -> bool:
     """Add base_board.js script tag to index.html."""
-    content = html_path.read_text()
+    content = html_path.read_text(encoding="utf-8")
     tag = '<script src="../4d_generic/base_board.js"></script>'
     if "base_board.js" in content:
         return False
     for anchor in ["grid_utils.js", "synergetics.js", "quadray.js"]:
         pattern = f'<script src="../4d_generic/{anchor}"></script>'
-        if pattern in content:
-            new_content = content.replace(pattern, f'{pattern}\n    {tag}')
+        idx = content.find(pattern)
+        if idx >= 0:
+            end = idx + len(pattern)
+            new_content = content[:end] + f'\n    {tag}' + content[end:]
             if not dry_run:
-                html_path.write_text(new_content)
+                _write(html_path, new_content, pending)
             logger.info(f"  ✅ {html_path.name}: added base_board.js import")
             return True
     return False
@@ -61,13 +86,13 @@ def add_baseboard_require(content: str) -> str:
     )
 
     # Find best insertion point: before GridUtils require
-    gu_match = re.search(r"if \(typeof GridUtils === 'undefined'", content)
+    gu_match = _GRIDUTILS_REQUIRE_RE.search(content)
     if gu_match:
         content = content[:gu_match.start()] + require_block + content[gu_match.start():]
         return content
 
     # Fallback: before class declaration
-    class_match = re.search(r'\nclass \w+Board', content)
+    class_match = _CLASS_DECL_RE.search(content)
     if class_match:
         content = content[:class_match.start()] + '\n' + require_block + content[class_match.start():]
     return content
@@ -77,7 +102,12 @@ def add_extends(content: str, class_name: str) -> str:
     """Add 'extends BaseBoard' to class declaration."""
     if f"extends BaseBoard" in content:
         return content
-    return content.replace(f"class {class_name} {{", f"class {class_name} extends BaseBoard {{")
+    decl = f"class {class_name} "
+    idx = content.find(decl + "{")
+    if idx < 0:
+        return content
+    end = idx + len(decl)
+    return content[:end] + "extends BaseBoard " + content[end:]
 
 
 def add_super_call(content: str, class_name: str) -> str:
@@ -89,7 +119,7 @@ def add_super_call(content: str, class_name: str) -> str:
         super_args = SUPER_CALL_OVERRIDES[class_name]
     else:
         # Find the constructor and its first parameter
-        ctor_match = re.search(r'constructor\(([^)]*)\)\s*\{', content)
+        ctor_match = _CTOR_RE.search(content)
         if not ctor_match:
             return content
         params = ctor_match.group(1)
@@ -97,7 +127,7 @@ def add_super_call(content: str, class_name: str) -> str:
         super_args = f"{size_param}, {{ name: '{class_name}', verify: false }}"
 
     # Find constructor opening brace and insert super() after it
-    ctor_match = re.search(r'(constructor\([^)]*\)\s*\{)', content)
+    ctor_match = _CTOR_RE.search(content)
     if ctor_match:
         insert_pos = ctor_match.end()
         # Check what's on the next line to match indentation
@@ -107,14 +137,21 @@ def add_super_call(content: str, class_name: str) -> str:
     return content
 
 
-def migrate_board(board_path: Path, dry_run: bool) -> dict:
+def migrate_board(board_path: Path, dry_run: bool, pending: dict | None = None) -> dict:
     """Conservative migration: extends + require + super only."""
-    content = board_path.read_text()
-    original = content
     stats = {"extended": False, "require_added": False, "super_added": False}
 
+    # Already-migrated boards need neither decoding nor any regex work
+    raw = board_path.read_bytes()
+    if b"extends BaseBoard" in raw:
+        logger.info(f"  ⏭️  {board_path.name}: already extends BaseBoard")
+        return stats
+
+    content = raw.decode("utf-8")
+    original = content
+
     # Find board class
-    class_match = re.search(r'class (\w+Board)\s*\{', content)
+    class_match = _CLASS_RE.search(content)
     if not class_match:
         logger.warning(f"  ⚠️  {board_path.name}: no Board class found")
         return stats
@@ -125,10 +162,6 @@ def migrate_board(board_path: Path, dry_run: bool) -> dict:
         logger.info(f"  ⏭️  {board_path.name}: {class_name} skipped (not grid-based)")
         return stats
 
-    if f"extends BaseBoard" in content:
-        logger.info(f"  ⏭️  {board_path.name}: already extends BaseBoard")
-        return stats
-
     # 1. Add require
     new_content = add_baseboard_require(content)
     if new_content != content:
@@ -150,12 +183,13 @@ def migrate_board(board_path: Path, dry_run: bool) -> dict:
         logger.info(f"  ✅ {board_path.name}: added super() call")
 
     if content != original and not dry_run:
-        board_path.write_text(content)
+        _write(board_path, content, pending)
 
     return stats
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     dry_run = "--apply" not in sys.argv
     if dry_run:
         logger.info("🔍 DRY RUN — use --apply to write changes.\n")
@@ -166,6 +200,7 @@ def main():
 
     skip_games = {"doom"}
     totals = {"html": 0, "boards": 0}
+    pending: dict[Path, str] = {}
 
     for key, meta in GAMES.items():
         if key in skip_games:
@@ -178,17 +213,20 @@ def main():
         # Update HTML
         html = game_dir / "index.html"
         if html.exists():
-            if add_baseboard_script(html, dry_run):
+            if add_baseboard_script(html, dry_run, pending):
                 totals["html"] += 1
 
         # Migrate board files
         js_dir = game_dir / "js"
         if js_dir.is_dir():
             for bf in list(js_dir.glob("*_board.js")) + list(js_dir.glob("board.js")):
-                stats = migrate_board(bf, dry_run)
+                stats = migrate_board(bf, dry_run, pending)
                 if stats["extended"]:
                     totals["boards"] += 1
 
+    # All edits are staged above and written in one pass at the end
+    flush_writes(pending)
+
     logger.info(f"\n{'='*50}")
     logger.info(f"📊 Summary: {totals['html']} HTML, {totals['boards']} boards migrated")
     if dry_run:
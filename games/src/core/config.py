@@ -57,6 +57,13 @@ REQUIRED_JS_PATTERNS = {
     "game":     "{game}_game.js",
 }
 
+# ─── Concurrency ────────────────────────────────────────────────────────────
+# Thread count for suite-wide scans. The work is file I/O, which releases
+# the GIL, so this deliberately exceeds the CPU count.
+SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+# Parallel test subprocesses (node/python) are CPU-bound once started.
+TEST_WORKERS = min(32, (os.cpu_count() or 2) * 2)
+
 # ─── Logging ────────────────────────────────────────────────────────────────
 LOG_PREFIX = "[QuadCraft]"
 
@@ -0,0 +1,27 @@
+"""
+games.src.core.discovery — Game directory discovery.
+
+Lists the 4d_* game directories under a games root (excluding the shared
+4d_generic module directory). The listing is cached per directory mtime,
+so tools that run several reports in one process scan the root once.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from .config import SHARED_DIR_NAME
+
+
+@lru_cache(maxsize=8)
+def _list_game_dirs(games_dir: str, mtime_ns: int) -> tuple[Path, ...]:
+    with os.scandir(games_dir) as it:
+        names = sorted(e.name for e in it
+                       if e.name.startswith("4d_") and e.name != SHARED_DIR_NAME and e.is_dir())
+    return tuple(Path(games_dir) / name for name in names)
+
+
+def list_game_dirs(games_dir: str | Path) -> tuple[Path, ...]:
+    """Sorted 4d_* game directories under games_dir, excluding 4d_generic."""
+    games_dir = os.fspath(games_dir)
+    return _list_game_dirs(games_dir, os.stat(games_dir).st_mtime_ns)
@@ -6,10 +6,18 @@ and port offsets for all 30 QuadCraft games. Used by launcher, testing,
 validation, and analytics modules.
 """
 
-import json
+import copy
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Union
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, NamedTuple, Union
+
+# orjson is an optional accelerator; stdlib json is the fallback.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 GAMES: Dict[str, Dict[str, Union[str, int]]] = {
@@ -47,21 +55,53 @@ GAMES: Dict[str, Dict[str, Union[str, int]]] = {
     "lights_out":    {"dir": "4d_lights_out",    "name": "4D Lights Out",    "port_offset": 29},
 }
 
+
+class GameMeta(NamedTuple):
+    """Attribute view of one GAMES entry."""
+    dir: str
+    name: str
+    port_offset: int
+
+
+# Port offsets in registry order with a key → index map, for get_port().
+# Like GAME_META below these are import-time snapshots: GAMES should not be
+# edited after import, and keys added later are served by falling back to it.
+_PORT_OFFSETS: tuple[int, ...] = tuple(m["port_offset"] for m in GAMES.values())
+_KEY_INDEX: Dict[str, int] = {k: i for i, k in enumerate(GAMES)}
+
+# Read-only, attribute-access copy of GAMES for hot paths (server
+# construction, port lookup), taken at import time. It is not a live view:
+# later edits to GAMES are not reflected, so callers that must see keys
+# added at runtime fall back to GAMES (see GameServer).
+GAME_META: Mapping[str, GameMeta] = MappingProxyType({
+    key: GameMeta(m["dir"], m["name"], m["port_offset"]) for key, m in GAMES.items()
+})
+
 logger.debug("[Registry] Loaded %d games", len(GAMES))
 
 
+@lru_cache(maxsize=32)
+def _parse_config(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file. Keyed on (path, mtime, size) so edits invalidate."""
+    return _json_loads(Path(path).read_bytes())
+
+
 def load_config(config_path: str) -> Dict[str, Any]:
     """Load game selection from a JSON config file.
 
     Expected format:
         {"games": ["chess", "doom"], "base_port": 8100, "open_browser": true}
+
+    Parsed results are cached per file until it changes on disk; callers
+    receive a deep copy so they may mutate it freely.
     """
-    path = Path(config_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    path = Path(config_path).resolve()
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
 
-    with open(path) as f:
-        data = json.load(f)
+    data = copy.deepcopy(_parse_config(str(path), st.st_mtime_ns, st.st_size))
     logger.info("[Registry] Loaded config from %s: %d game(s)", path.name, len(data.get("games", [])))
     return data
 
@@ -71,4 +111,7 @@ def get_port(game_key: str, base_port: int | None = None) -> int:
     if base_port is None:
         from .config import BASE_PORT
         base_port = BASE_PORT
-    return base_port + GAMES[game_key]["port_offset"]
+    i = _KEY_INDEX.get(game_key)
+    if i is None:  # registered after import
+        return base_port + GAMES[game_key]["port_offset"]
+    return base_port + _PORT_OFFSETS[i]
@@ -7,19 +7,203 @@ format: "=== Results: N passed, M failed ==="
 
 Supports running shared module tests (games/tests/, 4d_generic/tests/)
 and per-game tests (games/4d_*/tests/).
+
+JS test files run in persistent Node workers (see NodeRunner), one per
+runner thread, rather than a fresh `node` process per file.
 """
+import importlib.util
+import io
+import json
+import os
 import re
+import select
 import subprocess
 import sys
 import logging
+import threading
+import time
+import unittest
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from ..core.config import TEST_WORKERS
 from ..core.registry import GAMES
 
 logger = logging.getLogger(__name__)
 
+# Test files run concurrently; the lock keeps each report line whole.
+_PRINT_LOCK = threading.Lock()
+
+
+def _report(line: str) -> None:
+    with _PRINT_LOCK:
+        print(line)
+
+
 # Regex to parse the standardized results line
 RESULTS_RE = re.compile(r'Results:\s*(\d+)\s*passed,\s*(\d+)\s*failed', re.IGNORECASE)
 
+# unittest summary fields ("Ran N tests", "FAILED (failures=M, errors=K)"),
+# collected in one scan of the subprocess output
+_UNITTEST_SUMMARY_RE = re.compile(r'Ran (\d+) test|failures=(\d+)|errors=(\d+)|(FAILED)')
+
+# Per-file timeout for Node test files (seconds)
+NODE_TIMEOUT = 30
+
+_RESULTS_BYTES_RE = re.compile(RESULTS_RE.pattern.encode(), re.IGNORECASE)
+
+# Dispatcher for the persistent Node worker. Each stdin line is a test file
+# path, loaded as the main module (so `require.main === module` guards fire)
+# or imported if it is an ES module, with process.exit() intercepted. After each file it clears the require
+# cache and any globals the file added, then writes a sentinel line carrying
+# the exit code and captured stderr.
+_NODE_DISPATCHER = r"""
+const fs = require('fs');
+const Module = require('module');
+const readline = require('readline');
+const { pathToFileURL } = require('url');
+const SENTINEL = process.argv[1];
+const EXIT = Symbol('exit');
+const ESM_RE = /^\s*(import|export)\s/m;
+const realExit = process.exit;
+const realErrWrite = process.stderr.write;
+const baseGlobals = new Set(Object.getOwnPropertyNames(globalThis));
+let runs = 0;
+(async () => {
+    for await (const file of readline.createInterface({ input: process.stdin })) {
+        let code = 0, stderr = '';
+        process.stderr.write = (chunk) => { stderr += chunk; return true; };
+        process.exit = (c) => { code = c || 0; throw EXIT; };
+        process.argv[1] = file;
+        try {
+            if (ESM_RE.test(fs.readFileSync(file, 'utf8'))) {
+                // ES modules can't be evicted; a query string forces a fresh load
+                await import(pathToFileURL(file).href + '?run=' + (++runs));
+            } else {
+                Module._load(file, null, true);
+            }
+        } catch (e) {
+            if (e !== EXIT) { code = 1; stderr += (e && e.stack) || String(e); }
+        }
+        process.exit = realExit;
+        process.stderr.write = realErrWrite;
+        for (const k of Object.keys(require.cache)) delete require.cache[k];
+        for (const k of Object.getOwnPropertyNames(globalThis)) {
+            if (!baseGlobals.has(k)) delete globalThis[k];
+        }
+        process.stdout.write('\n' + SENTINEL + ' ' + JSON.stringify({ code, stderr }) + '\n');
+    }
+})();
+"""
+
+
+class NodeRunner:
+    """
+    Long-lived Node.js process that runs test files fed over stdin.
+
+    Amortizes interpreter and V8 startup across every test file a thread
+    runs. A file that exceeds the timeout kills the worker; the next run()
+    respawns it.
+    """
+
+    def __init__(self, cwd: Path):
+        self.cwd = cwd
+        self.proc: subprocess.Popen | None = None
+        self._sentinel = f"=== DONE {uuid.uuid4().hex} ==="
+        self._marker = ("\n" + self._sentinel + " ").encode()
+
+    def __enter__(self) -> "NodeRunner":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _spawn(self) -> None:
+        self.proc = subprocess.Popen(
+            ["node", "-e", _NODE_DISPATCHER, self._sentinel],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, cwd=str(self.cwd),
+        )
+
+    def run(self, tf: Path, timeout: float = NODE_TIMEOUT) -> subprocess.CompletedProcess:
+        """Run one test file; returns its exit code, stdout and stderr."""
+        if self.proc is None or self.proc.poll() is not None:
+            self._spawn()
+        self.proc.stdin.write(f"{tf.resolve()}\n".encode())
+        self.proc.stdin.flush()
+
+        fd = self.proc.stdout.fileno()
+        buf = bytearray()
+        deadline = time.monotonic() + timeout
+        results_seen = False
+        # Output is parsed as it streams in; each chunk only rescans the few
+        # bytes that could straddle the previous chunk boundary.
+        scan_from = 0
+        while True:
+            idx = buf.find(self._marker, scan_from)
+            if idx >= 0:
+                scan_from = idx
+                end = buf.find(b"\n", idx + len(self._marker))
+                if end >= 0:
+                    break
+            elif not results_seen and _RESULTS_BYTES_RE.search(buf, max(0, scan_from - 64)):
+                results_seen = True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                self.close()
+                if results_seen:
+                    # Counts are in; keep them and report the timeout via the exit code
+                    stdout = buf.decode("utf-8", errors="replace")
+                    return subprocess.CompletedProcess(
+                        ["node", str(tf)], -9, stdout,
+                        f"killed: no exit within {timeout}s after printing results")
+                raise subprocess.TimeoutExpired(["node", str(tf)], timeout)
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                self.close()
+                raise RuntimeError("Node worker exited unexpectedly")
+            if idx < 0:
+                scan_from = max(0, len(buf) - len(self._marker) + 1)
+            buf += chunk
+
+        status = json.loads(buf[idx + len(self._marker):end].decode())
+        stdout = buf[:idx].decode("utf-8", errors="replace")
+        return subprocess.CompletedProcess(["node", str(tf)], status["code"], stdout, status["stderr"])
+
+    def close(self) -> None:
+        if self.proc is None:
+            return
+        if self.proc.poll() is None:
+            self.proc.kill()
+        self.proc.wait()
+        self.proc.stdin.close()
+        self.proc.stdout.close()
+        self.proc = None
+
+
+# One worker per pool thread, closed by _run_jobs() when the batch is done
+_local = threading.local()
+_runners: list[NodeRunner] = []
+_runners_lock = threading.Lock()
+
+
+def _node_runner(cwd: Path) -> NodeRunner:
+    runner = getattr(_local, "runner", None)
+    if runner is None or runner.cwd != cwd:
+        if runner is not None:
+            runner.close()
+        runner = _local.runner = NodeRunner(cwd)
+        with _runners_lock:
+            _runners.append(runner)
+    return runner
+
+
+def _close_node_runners() -> None:
+    with _runners_lock:
+        for runner in _runners:
+            runner.close()
+        _runners.clear()
+
 
 def _run_test_file(tf: Path, cwd: Path, label: str) -> tuple[int, int]:
     """
@@ -31,11 +215,7 @@ def _run_test_file(tf: Path, cwd: Path, label: str) -> tuple[int, int]:
     Falls back to emoji counting if no results line found.
     """
     try:
-        result = subprocess.run(
-            ["node", str(tf)],
-            capture_output=True, text=True, cwd=str(cwd),
-            timeout=30  # Prevent hanging
-        )
+        result = _node_runner(cwd).run(tf)
 
         # Prefer structured results line
         match = RESULTS_RE.search(result.stdout)
@@ -58,35 +238,102 @@ def _run_test_file(tf: Path, cwd: Path, label: str) -> tuple[int, int]:
         if fail_count > 0:
             detail += f", {fail_count} failed"
 
-        print(f"  {status} {label:20s} — {detail}")
-
+        report = f"  {status} {label:20s} — {detail}"
         if result.returncode != 0 and result.stderr:
             for line in result.stderr.strip().split('\n')[:5]:
                 logger.debug(f"     {line}")
-            print(f"     (stderr available at DEBUG log level)")
+            report += "\n     (stderr available at DEBUG log level)"
+        # One write, so concurrent jobs can't split the pair of lines
+        _report(report)
 
         return (test_count, fail_count)
 
     except subprocess.TimeoutExpired:
-        print(f"  ❌ {label:20s} — TIMEOUT (30s)")
+        _report(f"  ❌ {label:20s} — TIMEOUT (30s)")
         logger.error(f"Test timed out: {tf}")
         return (0, 1)
     except FileNotFoundError:
-        print(f"  ❌ {label:20s} — Node.js not found in PATH")
+        _report(f"  ❌ {label:20s} — Node.js not found in PATH")
         return (0, 1)
     except Exception as e:
-        print(f"  ❌ {label:20s} — ERROR: {e}")
+        _report(f"  ❌ {label:20s} — ERROR: {e}")
         logger.exception(f"Unexpected error running {tf}")
         return (0, 1)
 
 
+# In-process Python test files share interpreter state, so run one at a time
+_PY_TEST_LOCK = threading.Lock()
+
+
+def _drop_modules_under(root: Path, names: set[str]) -> None:
+    """Unload the given modules if they were imported from inside root.
+
+    Keeps same-named test helpers from different games from shadowing
+    each other. Third-party and stdlib modules stay loaded; some (e.g.
+    C extensions) cannot be imported twice.
+    """
+    root = os.path.join(os.path.realpath(root), "")
+    for name in names:
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if path and os.path.realpath(path).startswith(root):
+            del sys.modules[name]
+
+
 def _run_python_test(tf: Path, cwd: Path, label: str) -> tuple[int, int]:
     """
-    Run a python unittest file and parse output.
+    Run a python unittest file in this interpreter and return (passed, failed).
+
+    Counts come straight from the unittest.TestResult. Set QC_TEST_ISOLATED=1
+    to run each file in its own interpreter instead.
+    """
+    if os.environ.get("QC_TEST_ISOLATED") == "1":
+        return _run_python_test_isolated(tf, cwd, label)
+
+    modname = f"_qatest_{tf.stem}"
+    try:
+        with _PY_TEST_LOCK:
+            saved_path = sys.path[:]
+            saved_modules = set(sys.modules)
+            # Same import root the subprocess path gets via PYTHONPATH
+            sys.path.insert(0, str(cwd))
+            spec = importlib.util.spec_from_file_location(modname, tf)
+            mod = importlib.util.module_from_spec(spec)
+            sys.modules[modname] = mod
+            try:
+                spec.loader.exec_module(mod)
+                suite = unittest.defaultTestLoader.loadTestsFromModule(mod)
+                result = unittest.TextTestRunner(stream=io.StringIO(), verbosity=0).run(suite)
+            finally:
+                sys.path[:] = saved_path
+                _drop_modules_under(cwd, set(sys.modules) - saved_modules)
+                sys.modules.pop(modname, None)
+
+        fail_count = len(result.failures) + len(result.errors) + len(result.unexpectedSuccesses)
+        pass_count = result.testsRun - fail_count
+
+        status = "✅" if fail_count == 0 else "❌"
+        detail = f"{pass_count} passed"
+        if fail_count > 0:
+            detail += f", {fail_count} failed"
+
+        _report(f"  {status} {label:20s} — {tf.name}: {detail}")
+
+        for _, trace in result.failures + result.errors:
+            logger.debug(f"     {trace.strip().splitlines()[-1]}")
+
+        return (pass_count, fail_count)
+
+    except Exception as e:
+        _report(f"  ❌ {label:20s} — ERROR executing {tf.name}: {e}")
+        return (0, 1)
+
+
+def _run_python_test_isolated(tf: Path, cwd: Path, label: str) -> tuple[int, int]:
+    """
+    Run a python unittest file in a subprocess and parse output.
     Format expected: "Ran N tests in ... OK" or "FAILED (failures=M)"
     """
     try:
-        import os
         env = os.environ.copy()
         # Add the working directory (repo_root) to PYTHONPATH so modules resolve
         env["PYTHONPATH"] = f"{cwd}{os.pathsep}{env.get('PYTHONPATH', '')}"
@@ -101,21 +348,21 @@ def _run_python_test(tf: Path, cwd: Path, label: str) -> tuple[int, int]:
         
         output = result.stderr + result.stdout # unittest prints to stderr usually
         
-        # Parse "Ran N tests"
-        run_match = re.search(r'Ran (\d+) test', output)
-        test_count = int(run_match.group(1)) if run_match else 0
+        # First occurrence of each summary field, in one pass
+        fields = [None, None, None, None]
+        for m in _UNITTEST_SUMMARY_RE.finditer(output):
+            i = m.lastindex - 1
+            if fields[i] is None:
+                fields[i] = m.group(m.lastindex)
+        ran, fails, errs, failed_marker = fields
+        test_count = int(ran) if ran else 0
         
         # Check success
         pass_count = test_count
         fail_count = 0
         
-        if result.returncode != 0 or "FAILED" in output:
-            # Parse failures
-            fail_match = re.search(r'failures=(\d+)', output)
-            err_match = re.search(r'errors=(\d+)', output)
-            fails = int(fail_match.group(1)) if fail_match else 0
-            errs = int(err_match.group(1)) if err_match else 0
-            fail_count = fails + errs
+        if result.returncode != 0 or failed_marker:
+            fail_count = int(fails or 0) + int(errs or 0)
             if fail_count == 0 and result.returncode != 0:
                  fail_count = 1 # Generic failure
             pass_count = test_count - fail_count
@@ -125,7 +372,7 @@ def _run_python_test(tf: Path, cwd: Path, label: str) -> tuple[int, int]:
         if fail_count > 0:
             detail += f", {fail_count} failed"
             
-        print(f"  {status} {label:20s} — {tf.name}: {detail}")
+        _report(f"  {status} {label:20s} — {tf.name}: {detail}")
         
         if fail_count > 0:
              # Print last few lines of failure
@@ -136,10 +383,32 @@ def _run_python_test(tf: Path, cwd: Path, label: str) -> tuple[int, int]:
         return (pass_count, fail_count)
 
     except Exception as e:
-        print(f"  ❌ {label:20s} — ERROR executing {tf.name}: {e}")
+        _report(f"  ❌ {label:20s} — ERROR executing {tf.name}: {e}")
         return (0, 1)
 
 
+def _run_jobs(jobs: list) -> tuple[int, int]:
+    """
+    Run (runner, test_file, cwd, label) jobs concurrently and sum the counts.
+
+    Each job is an independent subprocess, so threads only wait on pipes.
+    Lines are reported in completion order.
+    """
+    if not jobs:
+        return (0, 0)
+    passed = failed = 0
+    with ThreadPoolExecutor(max_workers=min(TEST_WORKERS, len(jobs))) as pool:
+        try:
+            futures = [pool.submit(*job) for job in jobs]
+            for fut in as_completed(futures):
+                p, f = fut.result()
+                passed += p
+                failed += f
+        finally:
+            _close_node_runners()
+    return (passed, failed)
+
+
 def run_tests(games_dir: Path, game_keys: list[str] | None = None) -> bool:
     """
     Run unit tests for the specified games (or all), plus shared module tests.
@@ -151,6 +420,7 @@ def run_tests(games_dir: Path, game_keys: list[str] | None = None) -> bool:
     failed = 0
     skipped = 0
     repo_root = games_dir.parent
+    jobs = []
 
     # ── Shared module tests (games/tests/ and games/4d_generic/tests/) ──
     # Run if no specific games requested, OR if we are running the full suite
@@ -173,17 +443,18 @@ def run_tests(games_dir: Path, game_keys: list[str] | None = None) -> bool:
             for tf in test_files:
                 if tf.name == "test_all_shared.js":
                     continue  # Skip the runner, run individual files
-                p, f = _run_test_file(tf, repo_root, label)
-                passed += p
-                failed += f
+                jobs.append((_run_test_file, tf, repo_root, label))
             
             # Python Tests (unittest)
             py_test_files = sorted(test_dir.glob("test_*.py")) if test_dir.is_dir() else []
             for tf in py_test_files:
                 # We'll run each python test file as a separate process to keep isolation
-                p, f = _run_python_test(tf, games_dir, label)
-                passed += p
-                failed += f
+                jobs.append((_run_python_test, tf, games_dir, label))
+
+        p, f = _run_jobs(jobs)
+        passed += p
+        failed += f
+        jobs = []
 
     # ── Per-game tests ──
     print(f"\n🎮 Running tests for {len(keys)} game(s)...\n")
@@ -204,20 +475,17 @@ def run_tests(games_dir: Path, game_keys: list[str] | None = None) -> bool:
             continue
 
         for tf in test_files:
-            p, f = _run_test_file(tf, repo_root, meta['name'])
-            passed += p
-            failed += f
+            jobs.append((_run_test_file, tf, repo_root, meta['name']))
+
+    p, f = _run_jobs(jobs)
+    passed += p
+    failed += f
 
     # ── Summary ──
-    print(f"\n{'═' * 48}")
-    print(f"  Total: {passed} passed, {failed} failed", end="")
+    total = f"  Total: {passed} passed, {failed} failed"
     if skipped > 0:
-        print(f", {skipped} skipped", end="")
-    print()
-    if failed == 0:
-        print("  ✅ All tests passed!")
-    else:
-        print("  ❌ Some tests failed — see output above.")
-    print(f"{'═' * 48}\n")
+        total += f", {skipped} skipped"
+    verdict = "  ✅ All tests passed!" if failed == 0 else "  ❌ Some tests failed — see output above."
+    sys.stdout.write(f"\n{'═' * 48}\n{total}\n{verdict}\n{'═' * 48}\n\n")
 
     return failed == 0
@@ -11,15 +11,22 @@ Verifies that each registered game has:
 Games using ES-module architecture (e.g. Doom) are exempt from
 shared-import checks since they use import/export syntax.
 """
+import hashlib
+import json
 import logging
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from ..core.registry import GAMES
 from ..core.config import (
     GENERIC_DIR, REQUIRED_FILES, REQUIRED_JS_PATTERNS,
     SHARED_MODULES as REQUIRED_SHARED_MODULES,
     OPTIONAL_SHARED_MODULES, LOG_PREFIX,
-    SHARED_DIR_NAME, ALL_SHARED_MODULES
+    SHARED_DIR_NAME, ALL_SHARED_MODULES, SCAN_WORKERS,
 )
 
 logger = logging.getLogger(__name__)
@@ -30,74 +37,195 @@ ES_MODULE_GAMES = {"doom"}
 # Minimum expected methods in board classes
 EXPECTED_BOARD_METHODS = ["getCell", "setCell"]
 
+# Required shared imports as (module, expected src path), built once
+_EXPECTED_IMPORTS = tuple((m, f"../{SHARED_DIR_NAME}/{m}") for m in REQUIRED_SHARED_MODULES)
+# Optional import whose absence triggers the BaseBoard migration advisory
+_BOARD_ADVISORY_MODULE = "base_board.js"
+
+# One pass over index.html finds every shared-module import. Longest names
+# go first so no alternative can shadow a longer one.
+_SHARED_IMPORT_RE = re.compile(
+    re.escape(f"../{SHARED_DIR_NAME}/")
+    + "(" + "|".join(re.escape(m) for m in sorted(set(REQUIRED_SHARED_MODULES) | {_BOARD_ADVISORY_MODULE},
+                                                  key=len, reverse=True)) + ")"
+)
+
+# Classifies js/ entries as board / renderer / game controller files in one
+# directory pass. ES-module games (Doom) also use *_map.js, *_render*.js and
+# *_main.js for those roles.
+_JS_ROLE_RE = re.compile(
+    r"^(?:(?P<board>(?:.*_)?board\.js)"
+    r"|(?P<renderer>(?:.*_)?renderer\.js)"
+    r"|(?P<game>(?:.*_)?game\.js))$"
+)
+_ES_JS_ROLE_RE = re.compile(
+    r"^(?:(?P<board>(?:.*_)?board\.js|.*_map\.js)"
+    r"|(?P<renderer>(?:.*_)?renderer\.js|.*_render.*\.js)"
+    r"|(?P<game>(?:.*_)?game\.js|.*_main\.js))$"
+)
+
+
+def _classify_js(js_entries: dict[str, os.DirEntry], es_module: bool) -> dict[str, list[Path]]:
+    """Sort a js/ listing (name → DirEntry) into 'board', 'renderer' and 'game' buckets."""
+    role_re = _ES_JS_ROLE_RE if es_module else _JS_ROLE_RE
+    roles = {"board": [], "renderer": [], "game": []}
+    for name in sorted(js_entries):
+        e = js_entries[name]
+        if name.startswith(".") or not e.is_file():
+            continue
+        m = role_re.match(name)
+        if m:
+            roles[m.lastgroup].append(Path(e.path))
+    return roles
+
+
+@lru_cache(maxsize=1024)
+def _cached_read(path: str, mtime_ns: int, size: int) -> str:
+    return Path(path).read_text(encoding="utf-8", errors="replace")
+
+
+def _read_text(path: Path) -> str:
+    """Read a file's text, cached until it changes on disk."""
+    st = os.stat(path)
+    return _cached_read(os.fspath(path), st.st_mtime_ns, st.st_size)
+
+
+# Scaffold-stub markers, matched in one pass over the raw bytes. The tag and
+# "... scaffold" phrases are case-insensitive; the TODO lines are exact.
+_SCAFFOLD_RE = re.compile(
+    rb"(?P<tag>(?i:\[scaffold\]))"
+    rb"|(?P<renderer>(?i:renderer scaffold))"
+    rb"|(?P<game>(?i:game scaffold))"
+    rb"|(?P<todo_render>TODO: Render game-specific)"
+    rb"|(?P<todo_game>TODO: Implement game-specific)"
+)
+# Smaller files are read outright; mmap setup doesn't pay off below this.
+_MMAP_MIN_SIZE = 4 * 1024
+
+
+@lru_cache(maxsize=1024)
+def _cached_scaffold_markers(path: str, mtime_ns: int, size: int) -> frozenset[str]:
+    if size < _MMAP_MIN_SIZE:
+        return frozenset(m.lastgroup for m in _SCAFFOLD_RE.finditer(Path(path).read_bytes()))
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return frozenset(m.lastgroup for m in _SCAFFOLD_RE.finditer(mm))
+
+
+def _scaffold_markers(path: Path) -> frozenset[str]:
+    """Names of the _SCAFFOLD_RE groups found in a file, cached until it changes."""
+    st = os.stat(path)
+    return _cached_scaffold_markers(os.fspath(path), st.st_mtime_ns, st.st_size)
+
+
+def clear_validation_cache() -> None:
+    """Drop all cached file contents (e.g. between long-running audits)."""
+    _cached_read.cache_clear()
+    _cached_scaffold_markers.cache_clear()
+    _cached_validate.cache_clear()
+
 
 def validate_game(games_dir: Path, key: str) -> list[str]:
-    """Validate a single game directory. Returns list of issues (empty = OK)."""
+    """Validate a single game directory. Returns list of issues (empty = OK).
+
+    Results are reused within the process while the game directory's
+    audit stamp (_max_mtime_bfs plus _content_hash) is unchanged; callers
+    get a fresh list each time. Computing the hash still reads index.html
+    and every js/*.js, so a repeat call saves the regex and parsing work,
+    not the I/O. That keeps this exact even for writes that preserve
+    mtimes; audit_all() is the mtime-trusting fast path.
+    """
+    game_dir = games_dir / GAMES[key]["dir"]
+    return _validate_stamped(games_dir, key, _max_mtime_bfs(game_dir), _content_hash(game_dir))
+
+
+def _validate_stamped(games_dir: Path, key: str, stamp: int, digest: str) -> list[str]:
+    issues, notes = _cached_validate(os.fspath(games_dir), key, stamp, digest)
+    # Advisory log lines are replayed so cached and fresh calls log alike
+    for level, msg in notes:
+        logger.log(level, msg)
+    return list(issues)
+
+
+@lru_cache(maxsize=256)
+def _cached_validate(games_dir: str, key: str, stamp: int,
+                     digest: str) -> tuple[tuple[str, ...], tuple[tuple[int, str], ...]]:
+    notes = []
+    issues = _validate_game(Path(games_dir), key, notes)
+    return tuple(issues), tuple(notes)
+
+
+def _validate_game(games_dir: Path, key: str, notes: list[tuple[int, str]]) -> list[str]:
     meta = GAMES[key]
     game_dir = games_dir / meta["dir"]
     issues = []
 
-    # 1. Directory exists
-    if not game_dir.is_dir():
+    # 1. Directory exists. One listing answers every presence check below.
+    try:
+        with os.scandir(game_dir) as it:
+            entries = {e.name: e for e in it}
+    except (FileNotFoundError, NotADirectoryError):
         issues.append(f"directory {meta['dir']} does not exist")
         return issues
 
     # 2. Required files
     index = game_dir / "index.html"
-    if not index.exists():
+    has_index = "index.html" in entries
+    if not has_index:
         issues.append("missing index.html")
     js_dir = game_dir / "js"
-    if not js_dir.is_dir():
+    has_js = "js" in entries and entries["js"].is_dir()
+    if not has_js:
         issues.append("missing js/ directory")
+        js_entries = {}
+    else:
+        # Likewise one js/ listing serves the quadray.js check and role lookup
+        with os.scandir(js_dir) as it:
+            js_entries = {e.name: e for e in it}
     tests_dir = game_dir / "tests"
-    if not tests_dir.is_dir():
+    if not ("tests" in entries and entries["tests"].is_dir()):
         issues.append("missing tests/ directory")
     else:
-        test_files = list(tests_dir.glob("test_*.js"))
-        if not test_files:
+        with os.scandir(tests_dir) as it:
+            has_tests = any(e.name.startswith("test_") and e.name.endswith(".js") for e in it)
+        if not has_tests:
             issues.append("tests/ has no test_*.js files")
 
     # 3-4. Shared module checks (skip for ES-module games)
     if key not in ES_MODULE_GAMES:
         # 3. No local quadray.js copy (should use shared)
-        local_quadray = js_dir / "quadray.js" if js_dir.is_dir() else None
-        if local_quadray and local_quadray.exists():
+        if "quadray.js" in js_entries:
             issues.append("local js/quadray.js exists (should use shared from 4d_generic/)")
 
         # 4. index.html imports required shared modules
-        if index.exists():
-            html = index.read_text()
-            for mod in REQUIRED_SHARED_MODULES:
-                expected = f"../{SHARED_DIR_NAME}/{mod}"
-                if expected not in html:
+        if has_index:
+            html = _read_text(index)
+            found = {m.group(1) for m in _SHARED_IMPORT_RE.finditer(html)}
+            for mod, expected in _EXPECTED_IMPORTS:
+                if mod not in found:
                     issues.append(f"index.html missing shared import: {expected}")
 
             # Advisory: check if board could benefit from BaseBoard
-            board_import = f"../{SHARED_DIR_NAME}/base_board.js"
-            if board_import not in html:
-                logger.info(f"{key}: board could be migrated to extend BaseBoard")
+            if _BOARD_ADVISORY_MODULE not in found:
+                notes.append((logging.INFO, f"{key}: board could be migrated to extend BaseBoard"))
 
     else:
-        logger.debug(f"Skipping shared-import checks for ES-module game: {key}")
+        notes.append((logging.DEBUG, f"Skipping shared-import checks for ES-module game: {key}"))
 
     # 5. AGENTS.md exists
-    if not (game_dir / "AGENTS.md").exists():
+    if "AGENTS.md" not in entries:
         issues.append("missing AGENTS.md")
 
     # 6. Board logic file exists and has real content (not scaffold)
-    if js_dir.is_dir():
-        # Check for *_board.js OR board.js
-        board_files = list(js_dir.glob("*_board.js")) + list(js_dir.glob("board.js"))
-        
-        # Exception for Doom (uses doom_map.js)
-        if key == "doom":
-            board_files += list(js_dir.glob("*_map.js"))
+    if has_js:
+        # Check for *_board.js OR board.js (Doom: doom_map.js)
+        js_roles = _classify_js(js_entries, key in ES_MODULE_GAMES)
+        board_files = js_roles["board"]
 
         if not board_files:
             issues.append(f"no *_board.js or board.js file found in js/")
         else:
             for bf in board_files:
-                content = bf.read_text()
+                content = _read_text(bf)
                 if len(content) < 200:
                     issues.append(f"{bf.name}: suspiciously small ({len(content)} bytes)")
                 
@@ -110,49 +238,128 @@ def validate_game(games_dir: Path, key: str) -> list[str]:
                         # issues.append(f"{bf.name}: missing {method}() method")
 
         # 7. Renderer not a scaffold
-        renderer_files = list(js_dir.glob("*_renderer.js")) + list(js_dir.glob("renderer.js"))
-        # Doom exception
-        if key == "doom":
-            renderer_files += list(js_dir.glob("*_render*.js"))
-            
+        renderer_files = js_roles["renderer"]
         for rf in renderer_files:
-            content = rf.read_text()
-            if "[scaffold]" in content.lower() or "renderer scaffold" in content.lower():
+            markers = _scaffold_markers(rf)
+            if "tag" in markers or "renderer" in markers:
                 issues.append(f"{rf.name}: still a scaffold stub")
-            if "TODO: Render game-specific" in content:
+            if "todo_render" in markers:
                 issues.append(f"{rf.name}: contains scaffold TODO")
 
         # 8. Game controller not a scaffold
-        game_files = list(js_dir.glob("*_game.js")) + list(js_dir.glob("game.js"))
-        # Doom exception
-        if key == "doom":
-             game_files += list(js_dir.glob("*_main.js"))
-
+        game_files = js_roles["game"]
         for gf in game_files:
-            content = gf.read_text()
-            if "[scaffold]" in content.lower() or "game scaffold" in content.lower():
+            markers = _scaffold_markers(gf)
+            if "tag" in markers or "game" in markers:
                 issues.append(f"{gf.name}: still a scaffold stub")
-            if "TODO: Implement game-specific" in content:
+            if "todo_game" in markers:
                 issues.append(f"{gf.name}: contains scaffold TODO")
 
     return issues
 
 
+# ─── Audit cache ─────────────────────────────────────────────────────────────
+# audit_all() stores each game's issues alongside a stamp: the newest mtime
+# found in the game directory (to AUDIT_STAMP_DEPTH levels). A game whose
+# stamp is unchanged replays its cached issues without reading any files.
+# When the stamp differs (or mtimes are unreliable, e.g. on bind mounts), a
+# content hash of everything validate_game() looks at gets a second chance
+# before falling back to a full validation.
+#
+# Unlike validate_game(), a stamp hit here skips the hash on purpose: the
+# audit cache exists to make unchanged repo-wide runs read no files, at the
+# cost of missing edits that preserve every mtime. Run with use_cache=False
+# (run_games.py --no-cache) when that matters.
+AUDIT_CACHE_PATH = Path(".cache") / "audit.json"  # relative to games_dir
+AUDIT_STAMP_DEPTH = 3
+
+
+def _max_mtime_bfs(root: Path, max_depth: int = AUDIT_STAMP_DEPTH) -> int:
+    """Newest st_mtime_ns under root (inclusive), or -1 if root is missing."""
+    try:
+        newest = os.stat(root).st_mtime_ns
+    except OSError:
+        return -1
+    frontier = [os.fspath(root)]
+    for _ in range(max_depth):
+        next_frontier = []
+        for d in frontier:
+            try:
+                with os.scandir(d) as it:
+                    for e in it:
+                        newest = max(newest, e.stat().st_mtime_ns)
+                        if e.is_dir(follow_symlinks=False):
+                            next_frontier.append(e.path)
+            except OSError:
+                continue
+        if not next_frontier:
+            break
+        frontier = next_frontier
+    return newest
+
+
+def _content_hash(game_dir: Path) -> str:
+    """blake2b over the entry names validate_game() checks and the files it reads."""
+    h = hashlib.blake2b(digest_size=16)
+    for sub in ("", "js", "tests"):
+        d = game_dir / sub if sub else game_dir
+        try:
+            with os.scandir(d) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            h.update(b"\0missing:" + sub.encode())
+            continue
+        for e in entries:
+            h.update(b"\0" + sub.encode() + b"/" + e.name.encode("utf-8", "surrogateescape"))
+            if e.is_file() and (e.name == "index.html" if not sub else sub == "js" and e.name.endswith(".js")):
+                with open(e.path, "rb") as f:
+                    h.update(f.read())
+    return h.hexdigest()
+
+
+def _cache_signature() -> int:
+    """Changes whenever the validation rules or their config change."""
+    from ..core import config
+    return max(os.stat(__file__).st_mtime_ns, os.stat(config.__file__).st_mtime_ns)
+
+
+def _audit_cache_load(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("signature") != _cache_signature():
+        return {}
+    return data.get("games", {})
+
+
+def _audit_cache_save(path: Path, games: dict) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"signature": _cache_signature(), "games": games}),
+                        encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not write audit cache {path}: {e}")
+
+
 def check_shared_dir(games_dir: Path) -> list[str]:
     """Verify that the shared 4d_generic directory has all required modules."""
     shared_dir = games_dir / SHARED_DIR_NAME
-    issues = []
-    if not shared_dir.is_dir():
-        issues.append(f"{SHARED_DIR_NAME}/ directory not found")
-        return issues
-    for mod in ALL_SHARED_MODULES:
-        if not (shared_dir / mod).exists():
-            issues.append(f"{SHARED_DIR_NAME}/{mod} missing")
-    return issues
+    try:
+        with os.scandir(shared_dir) as it:
+            present = frozenset(e.name for e in it)
+    except (FileNotFoundError, NotADirectoryError):
+        return [f"{SHARED_DIR_NAME}/ directory not found"]
+    return [f"{SHARED_DIR_NAME}/{mod} missing" for mod in ALL_SHARED_MODULES if mod not in present]
+
 
+def audit_all(games_dir: Path, use_cache: bool = True) -> bool:
+    """Run full validation audit. Returns True if all pass.
 
-def audit_all(games_dir: Path) -> bool:
-    """Run full validation audit. Returns True if all pass."""
+    With use_cache, games unchanged since the last audit (see
+    AUDIT_CACHE_PATH) reuse their previous issues; use_cache=False
+    revalidates everything and rebuilds the cache.
+    """
     print("\n🔍 QuadCraft Structural Validation\n")
     all_ok = True
     game_count = len(GAMES)
@@ -168,24 +375,54 @@ def audit_all(games_dir: Path) -> bool:
     else:
         print(f"  ✅ {SHARED_DIR_NAME}/ — all {len(ALL_SHARED_MODULES)} shared modules present")
 
-    # Check each game
-    for key in GAMES:
-        issues = validate_game(games_dir, key)
+    cache_path = games_dir / AUDIT_CACHE_PATH
+    cache = _audit_cache_load(cache_path) if use_cache else {}
+    new_cache = {}
+
+    def check(key: str) -> list[str]:
+        # Stamp before validating, so edits made mid-scan invalidate next time
+        game_dir = games_dir / GAMES[key]["dir"]
+        stamp = _max_mtime_bfs(game_dir)
+        cached = cache.get(key)
+        if cached and cached["stamp"] == stamp:
+            new_cache[key] = cached
+            return cached["issues"]
+        digest = _content_hash(game_dir)
+        if cached and cached.get("hash") == digest:
+            issues = cached["issues"]
+        else:
+            issues = _validate_stamped(games_dir, key, stamp, digest)
+        new_cache[key] = {"stamp": stamp, "hash": digest, "issues": issues}
+        return issues
+
+    # Check each game. Validation is independent per game and I/O-bound;
+    # map() keeps GAMES order for the report.
+    if game_count < 8:
+        results = [check(key) for key in GAMES]
+    else:
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            results = list(pool.map(check, GAMES))
+    _audit_cache_save(cache_path, new_cache)
+
+    # Report lines are collected and written once rather than print()ed
+    # per line.
+    out = []
+    for key, issues in zip(GAMES, results):
         meta = GAMES[key]
         if issues:
-            print(f"  ❌ {meta['name']:20s}")
-            for issue in issues:
-                print(f"     → {issue}")
+            out.append(f"  ❌ {meta['name']:20s}\n")
+            out.extend(f"     → {issue}\n" for issue in issues)
             all_ok = False
         else:
-            print(f"  ✅ {meta['name']:20s} — OK")
+            out.append(f"  ✅ {meta['name']:20s} — OK\n")
             pass_count += 1
 
-    print()
-    print(f"  Games checked: {game_count} | Passed: {pass_count} | Failed: {game_count - pass_count}")
+    out.append("\n")
+    out.append(f"  Games checked: {game_count} | Passed: {pass_count} | Failed: {game_count - pass_count}\n")
     if all_ok:
-        print("  ✅ All validations passed!")
+        out.append("  ✅ All validations passed!\n")
     else:
-        print("  ❌ Some validations failed. See issues above.")
-    print()
+        out.append("  ❌ Some validations failed. See issues above.\n")
+    out.append("\n")
+    sys.stdout.write("".join(out))
     return all_ok
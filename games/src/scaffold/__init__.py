@@ -14,188 +14,136 @@ Usage:
 import logging
 import os
 import json
+import string
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-from ..core.config import GAMES_DIR, GENERIC_DIR, SHARED_MODULES, OPTIONAL_SHARED_MODULES, REQUIRED_FILES, SHARED_DIR_NAME
+from ..core.config import GAMES_DIR, GENERIC_DIR, SHARED_MODULES, OPTIONAL_SHARED_MODULES, REQUIRED_FILES, SHARED_DIR_NAME, SCAN_WORKERS
+from ..shared import resolve_module_path
 
 logger = logging.getLogger(__name__)
 
 # ─── Script tag template ────────────────────────────────────────────────────
 _SCRIPT_TAG = '    <script src="../4d_generic/{module}"></script>'
-
-
-class GameScaffold:
-    """Generates a new game directory from the QuadCraft template."""
-
-    def __init__(self, game_key: str, display_name: str, *,
-                 grid_size: int = 8, tick_rate: int = 16,
-                 optional_modules: list[str] | None = None):
-        self.game_key = game_key
-        self.display_name = display_name
-        self.grid_size = grid_size
-        self.tick_rate = tick_rate
-        self.optional_modules = optional_modules or []
-        self.dir_name = f"4d_{game_key}"
-        self.game_dir = Path(GAMES_DIR) / self.dir_name
-        # Validate optional module names
-        valid = set(OPTIONAL_SHARED_MODULES)
-        invalid = [m for m in self.optional_modules if m not in valid]
-        if invalid:
-            raise ValueError(f"Unknown optional modules: {invalid}. Valid: {sorted(valid)}")
-        logger.info("[Scaffold] Initialized for %s → %s (optional: %s)",
-                    game_key, self.game_dir, self.optional_modules or 'none')
-
-    # ── Public API ───────────────────────────────────────────────────────────
-
-    def create(self, *, overwrite: bool = False) -> Path:
-        """Create the full game directory structure. Returns the path."""
-        if self.game_dir.exists() and not overwrite:
-            raise FileExistsError(f"Directory already exists: {self.game_dir}")
-
-        self.game_dir.mkdir(parents=True, exist_ok=True)
-        js_dir = self.game_dir / "js"
-        js_dir.mkdir(exist_ok=True)
-        tests_dir = self.game_dir / "tests"
-        tests_dir.mkdir(exist_ok=True)
-
-        self._write_board(js_dir)
-        self._write_renderer(js_dir)
-        self._write_game(js_dir)
-        self._write_html()
-        self._write_run_sh()
-        self._write_agents_md()
-        self._write_manifest()
-        self._write_test_stub(tests_dir)
-
-        logger.info("[Scaffold] Created game: %s at %s", self.display_name, self.game_dir)
-        return self.game_dir
-
-    def validate(self) -> list:
-        """Check that all required files exist. Returns list of issues."""
-        issues = []
-        for f in REQUIRED_FILES:
-            if not (self.game_dir / f).exists():
-                issues.append(f"Missing required file: {f}")
-        for pattern_key, pattern in [("board", f"{self.game_key}_board.js"),
-                                      ("renderer", f"{self.game_key}_renderer.js"),
-                                      ("game", f"{self.game_key}_game.js")]:
-            if not (self.game_dir / "js" / pattern).exists():
-                issues.append(f"Missing JS module: js/{pattern}")
-        if issues:
-            logger.warning("[Scaffold] Validation issues: %s", issues)
-        return issues
-
-    # ── Private generators ───────────────────────────────────────────────────
-
-    def _class_name(self, suffix: str) -> str:
-        parts = self.game_key.split('_')
-        return ''.join(p.capitalize() for p in parts) + suffix
-
-    def _write_board(self, js_dir: Path):
-        cls = self._class_name('Board')
-        content = f"""/**
- * {self.game_key}_board.js — {self.display_name} Board Logic
- * @module {cls}
+# SHARED_MODULES is fixed, so its tag block and AGENTS.md list are built once
+_SCRIPT_TAGS_BLOCK = '\n'.join(_SCRIPT_TAG.format(module=m) for m in SHARED_MODULES)
+_SHARED_MODULES_MD = ', '.join('`' + m + '`' for m in SHARED_MODULES)
+# bundle=True replaces the per-module tags with one concatenated file
+_BUNDLE_NAME = "shared_bundle.js"
+_BUNDLE_TAG = f'    <script src="js/{_BUNDLE_NAME}"></script>'
+
+# ─── File templates ─────────────────────────────────────────────────────────
+# Parsed once at import; GameScaffold's writers only substitute per-game values.
+# `$$` is a literal `$` (JS template literals).
+
+_BOARD_TPL = string.Template("""/**
+ * ${game_key}_board.js — ${display_name} Board Logic
+ * @module ${cls}
  */
-class {cls} {{
-    constructor(size = {self.grid_size}) {{
+class ${cls} {
+    constructor(size = ${grid_size}) {
         this.size = size;
         this.gameOver = false;
         this.score = 0;
         this.level = 1;
         this.lives = 3;
         this.grid = this._createGrid(size);
-        console.log('[{cls}] Created {self.grid_size}⁴ grid');
-    }}
-
-    _createGrid(size) {{
-        const grid = [];
+        console.log('[${cls}] Created ${grid_size}⁴ grid');
+    }
+
+    _createGrid(size) {
+        // Structure-of-arrays: cell i is (a[i], b[i], c[i], d[i]) with value[i]
+        const n = size * size * size * size;
+        const grid = {
+            length: n,
+            a: new Uint8Array(n), b: new Uint8Array(n),
+            c: new Uint8Array(n), d: new Uint8Array(n),
+            value: new Uint8Array(n),
+        };
+        let i = 0;
         for (let a = 0; a < size; a++)
             for (let b = 0; b < size; b++)
                 for (let c = 0; c < size; c++)
-                    for (let d = 0; d < size; d++)
-                        grid.push({{ a, b, c, d, value: 0 }});
+                    for (let d = 0; d < size; d++, i++) {
+                        grid.a[i] = a; grid.b[i] = b; grid.c[i] = c; grid.d[i] = d;
+                    }
         return grid;
-    }}
+    }
 
-    step() {{
+    step() {
         // Override in subclass
-    }}
+    }
 
-    reset() {{
+    reset() {
         this.gameOver = false;
         this.score = 0;
         this.level = 1;
         this.lives = 3;
         this.grid = this._createGrid(this.size);
-    }}
-}}
+    }
+}
 
-if (typeof module !== 'undefined' && module.exports) {{
-    module.exports = {{ {cls} }};
-}}
-"""
-        (js_dir / f"{self.game_key}_board.js").write_text(content)
-        logger.debug("[Scaffold] Wrote board: %s", f"{self.game_key}_board.js")
-
-    def _write_renderer(self, js_dir: Path):
-        cls = self._class_name('Renderer')
-        board_cls = self._class_name('Board')
-        content = f"""/**
- * {self.game_key}_renderer.js — {self.display_name} Renderer
- * @module {cls}
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { ${cls} };
+}
+""")
+
+_RENDERER_TPL = string.Template("""/**
+ * ${game_key}_renderer.js — ${display_name} Renderer
+ * @module ${cls}
  */
-class {cls} {{
-    constructor(canvas, board) {{
+class ${cls} {
+    constructor(canvas, board) {
         this.canvas = canvas;
         this.ctx = canvas.getContext('2d');
         this.board = board;
         this.scale = 35;
         this.rotX = 0;
         this.rotY = 0;
-    }}
+    }
 
-    render() {{
-        const {{ ctx, canvas }} = this;
+    render() {
+        const { ctx, canvas } = this;
         ctx.fillStyle = '#0f172a';
         ctx.fillRect(0, 0, canvas.width, canvas.height);
-        // Draw grid cells
-        for (const cell of this.board.grid) {{
-            const p = this._project(cell.a, cell.b, cell.c, cell.d);
-            ctx.beginPath();
-            ctx.arc(p.x, p.y, 3 * p.scale, 0, Math.PI * 2);
-            ctx.fillStyle = cell.value ? '#60a5fa' : 'rgba(100,116,139,0.3)';
-            ctx.fill();
-        }}
-    }}
-
-    _project(a, b, c, d) {{
-        if (typeof projectQuadray !== 'undefined') {{
+        // Draw grid cells: one path per colour, so two fills instead of one per cell
+        const g = this.board.grid;
+        const on = new Path2D(), off = new Path2D();
+        for (let i = 0; i < g.length; i++) {
+            const p = this._project(g.a[i], g.b[i], g.c[i], g.d[i]);
+            const r = 3 * p.scale;
+            const path = g.value[i] ? on : off;
+            path.moveTo(p.x + r, p.y);
+            path.arc(p.x, p.y, r, 0, Math.PI * 2);
+        }
+        ctx.fillStyle = 'rgba(100,116,139,0.3)';
+        ctx.fill(off);
+        ctx.fillStyle = '#60a5fa';
+        ctx.fill(on);
+    }
+
+    _project(a, b, c, d) {
+        if (typeof projectQuadray !== 'undefined') {
             return projectQuadray(a, b, c, d, this);
-        }}
+        }
         const cx = this.canvas.width / 2;
         const cy = this.canvas.height / 2;
-        return {{
+        return {
             x: cx + (a - b) * this.scale,
             y: cy + (c - d) * this.scale,
             scale: 1
-        }};
-    }}
-}}
+        };
+    }
+}
 
-if (typeof module !== 'undefined' && module.exports) {{
-    module.exports = {{ {cls} }};
-}}
-"""
-        (js_dir / f"{self.game_key}_renderer.js").write_text(content)
-        logger.debug("[Scaffold] Wrote renderer: %s", f"{self.game_key}_renderer.js")
-
-    def _write_game(self, js_dir: Path):
-        cls = self._class_name('Game')
-        board_cls = self._class_name('Board')
-        renderer_cls = self._class_name('Renderer')
-        content = f"""/**
- * {self.game_key}_game.js — {self.display_name} Game Controller
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { ${cls} };
+}
+""")
+
+_GAME_TPL = string.Template("""/**
+ * ${game_key}_game.js — ${display_name} Game Controller
  *
  * Uses GameLoop for update/render cycle and InputController for input.
  *
@@ -203,192 +151,155 @@ if (typeof module !== 'undefined' && module.exports) {{
  *   P : Pause/Resume
  *   R : Reset
  *
- * @module {cls}
+ * @module ${cls}
  */
-class {cls} {{
-    constructor(canvas, hudElement) {{
+class ${cls} {
+    constructor(canvas, hudElement) {
         this.canvas = canvas;
         this.hudElement = hudElement;
-        this.board = new {board_cls}();
-        this.renderer = new {renderer_cls}(canvas, this.board);
+        this.board = new ${board_cls}();
+        this.renderer = new ${renderer_cls}(canvas, this.board);
 
         this.input = new InputController();
         this._setupInput();
 
-        this.loop = new GameLoop({{
+        this.loop = new GameLoop({
             update: () => this.update(),
-            render: () => {{
+            render: () => {
                 this.renderer.render();
                 this._updateHUD();
-            }},
-            tickRate: {self.tick_rate}
-        }});
-
-        if (typeof CameraController !== 'undefined') {{
-            this.camera = new CameraController(canvas, {{ mode: 'shift-drag' }});
-        }}
-        if (typeof setupZoom !== 'undefined') {{
-            setupZoom(canvas, this.renderer, {{ min: 20, max: 100 }});
-        }}
-    }}
-
-    init() {{
+            },
+            tickRate: ${tick_rate}
+        });
+
+        if (typeof CameraController !== 'undefined') {
+            this.camera = new CameraController(canvas, { mode: 'shift-drag' });
+        }
+        if (typeof setupZoom !== 'undefined') {
+            setupZoom(canvas, this.renderer, { min: 20, max: 100 });
+        }
+    }
+
+    init() {
         this.input.attach();
         this.loop.start();
-        console.log('[{cls}] Initialized');
-    }}
+        console.log('[${cls}] Initialized');
+    }
 
-    update() {{
+    update() {
         if (this.board.gameOver) return;
         this.board.step();
-    }}
+    }
 
-    reset() {{
+    reset() {
         this.loop.stop();
         this.board.reset();
         this.loop.start();
-    }}
+    }
 
-    _setupInput() {{
+    _setupInput() {
         this.input.bind(['p'], () => this.loop.togglePause());
         this.input.bind(['r'], () => this.reset());
-    }}
+    }
 
-    _updateHUD() {{
+    _updateHUD() {
         if (!this.hudElement) return;
         const b = this.board;
-        if (b.gameOver) {{
+        if (b.gameOver) {
             this.hudElement.textContent = '💀 GAME OVER | Press R to restart';
             this.hudElement.style.color = '#f87171';
-        }} else if (this.loop.paused) {{
+        } else if (this.loop.paused) {
             this.hudElement.textContent = '⏸ PAUSED — Press P to continue';
             this.hudElement.style.color = '#fbbf24';
-        }} else {{
-            this.hudElement.textContent = `Score: ${{b.score}} | Level: ${{b.level}} | Lives: ${{b.lives}}`;
+        } else {
+            this.hudElement.textContent = `Score: $${b.score} | Level: $${b.level} | Lives: $${b.lives}`;
             this.hudElement.style.color = '#94a3b8';
-        }}
-    }}
-}}
+        }
+    }
+}
 
-if (typeof module !== 'undefined' && module.exports) {{
-    module.exports = {{ {cls} }};
-}}
-"""
-        (js_dir / f"{self.game_key}_game.js").write_text(content)
-        logger.debug("[Scaffold] Wrote game controller: %s", f"{self.game_key}_game.js")
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { ${cls} };
+}
+""")
 
-    def _write_html(self):
-        script_tags = '\n'.join(_SCRIPT_TAG.format(module=m) for m in SHARED_MODULES)
-        # Add optional modules if requested
-        if self.optional_modules:
-            opt_tags = '\n'.join(_SCRIPT_TAG.format(module=m) for m in self.optional_modules)
-            script_tags += '\n\n    <!-- Optional shared modules -->\n' + opt_tags
-        content = f"""<!DOCTYPE html>
+_HTML_TPL = string.Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.display_name} — QuadCraft</title>
+    <title>${display_name} — QuadCraft</title>
     <link rel="stylesheet" href="../4d_generic/hud-style.css">
     <style>
-        body {{ margin: 0; background: #0f172a; color: #e2e8f0; font-family: 'Inter', sans-serif; display: flex; flex-direction: column; align-items: center; }}
-        h1 {{ margin: 1rem 0 0.5rem; font-size: 1.6rem; }}
-        canvas {{ border: 1px solid #334155; border-radius: 8px; }}
-        #hud {{ margin-top: 0.5rem; font-family: monospace; font-size: 0.95rem; color: #94a3b8; text-align: center; }}
+        body { margin: 0; background: #0f172a; color: #e2e8f0; font-family: 'Inter', sans-serif; display: flex; flex-direction: column; align-items: center; }
+        h1 { margin: 1rem 0 0.5rem; font-size: 1.6rem; }
+        canvas { border: 1px solid #334155; border-radius: 8px; }
+        #hud { margin-top: 0.5rem; font-family: monospace; font-size: 0.95rem; color: #94a3b8; text-align: center; }
     </style>
 </head>
 <body>
-    <h1>🎮 {self.display_name}</h1>
+    <h1>🎮 ${display_name}</h1>
     <canvas id="gameCanvas" width="600" height="600"></canvas>
     <div id="hud">Loading…</div>
 
     <!-- Shared modules -->
-{script_tags}
+${script_tags}
 
     <!-- Game-specific modules -->
-    <script src="js/{self.game_key}_board.js"></script>
-    <script src="js/{self.game_key}_renderer.js"></script>
-    <script src="js/{self.game_key}_game.js"></script>
+    <script src="js/${game_key}_board.js"></script>
+    <script src="js/${game_key}_renderer.js"></script>
+    <script src="js/${game_key}_game.js"></script>
 
     <script>
         const canvas = document.getElementById('gameCanvas');
         const hud = document.getElementById('hud');
-        const game = new {self._class_name('Game')}(canvas, hud);
+        const game = new ${game_cls}(canvas, hud);
         game.init();
     </script>
 </body>
 </html>
-"""
-        (self.game_dir / "index.html").write_text(content)
-        logger.debug("[Scaffold] Wrote index.html")
+""")
 
-    def _write_run_sh(self):
-        content = f"""#!/usr/bin/env bash
-# Run {self.display_name} locally
-cd "$(dirname "$0")"
+_RUN_SH_TPL = string.Template("""#!/usr/bin/env bash
+# Run ${display_name} locally
+cd "$$(dirname "$$0")"
 python3 -m http.server 8080 &
 open http://localhost:8080/index.html
-"""
-        run_sh = self.game_dir / "run.sh"
-        run_sh.write_text(content)
-        run_sh.chmod(0o755)
-        logger.debug("[Scaffold] Wrote run.sh")
+""")
 
-    def _write_agents_md(self):
-        cls = self._class_name('')
-        all_mods = SHARED_MODULES + self.optional_modules
-        content = f"""# {self.display_name} — AGENTS.md
+_AGENTS_MD_TPL = string.Template("""# ${display_name} — AGENTS.md
 
 ## Architecture
-- **Board** (`js/{self.game_key}_board.js`): Game state, grid, logic, step.
-- **Renderer** (`js/{self.game_key}_renderer.js`): Canvas 2D rendering with Quadray projection.
-- **Game Controller** (`js/{self.game_key}_game.js`): GameLoop, InputController, HUD, camera integration.
+- **Board** (`js/${game_key}_board.js`): Game state, grid, logic, step.
+- **Renderer** (`js/${game_key}_renderer.js`): Canvas 2D rendering with Quadray projection.
+- **Game Controller** (`js/${game_key}_game.js`): GameLoop, InputController, HUD, camera integration.
 
 ## Shared Modules
-Depends on: {', '.join('`' + m + '`' for m in all_mods)}
+Depends on: ${modules_md}
 
 ## Controls
 | Key | Action |
 |-----|--------|
 | P   | Pause/Resume |
 | R   | Reset |
-"""
-        (self.game_dir / "AGENTS.md").write_text(content)
-        logger.debug("[Scaffold] Wrote AGENTS.md")
-
-    def _write_manifest(self):
-        manifest = {
-            "key": self.game_key,
-            "name": self.display_name,
-            "dir": self.dir_name,
-            "grid_size": self.grid_size,
-            "tick_rate": self.tick_rate,
-            "shared_modules": SHARED_MODULES,
-            "optional_modules": self.optional_modules,
-        }
-        (self.game_dir / "manifest.json").write_text(
-            json.dumps(manifest, indent=2) + '\n'
-        )
-        logger.debug("[Scaffold] Wrote manifest.json")
+""")
 
-    def _write_test_stub(self, tests_dir: Path):
-        board_cls = self._class_name('Board')
-        content = f"""/**
- * test_{self.game_key}.js — Basic tests for {self.display_name}
+_TEST_STUB_TPL = string.Template("""/**
+ * test_${game_key}.js — Basic tests for ${display_name}
  */
-const {{ {board_cls} }} = require('../js/{self.game_key}_board.js');
+const { ${board_cls} } = require('../js/${game_key}_board.js');
 
 let passed = 0;
 let failed = 0;
 
-function assert(cond, msg) {{
-    if (cond) {{ passed++; console.log(`  ✅ ${{msg}}`); }}
-    else      {{ failed++; console.log(`  ❌ ${{msg}}`); }}
-}}
+function assert(cond, msg) {
+    if (cond) { passed++; console.log(`  ✅ $${msg}`); }
+    else      { failed++; console.log(`  ❌ $${msg}`); }
+}
 
 // ── Board creation ──
-const board = new {board_cls}();
-assert(board.size === {self.grid_size}, 'default grid size');
+const board = new ${board_cls}();
+assert(board.size === ${grid_size}, 'default grid size');
 assert(board.gameOver === false, 'starts not game-over');
 assert(board.score === 0, 'initial score is 0');
 assert(board.grid.length > 0, 'grid is populated');
@@ -398,8 +309,245 @@ board.score = 42;
 board.reset();
 assert(board.score === 0, 'reset clears score');
 
-console.log(`\\n=== Results: ${{passed}} passed, ${{failed}} failed ===`);
+console.log(`\\n=== Results: $${passed} passed, $${failed} failed ===`);
 process.exit(failed > 0 ? 1 : 0);
-"""
-        (tests_dir / f"test_{self.game_key}.js").write_text(content)
-        logger.debug("[Scaffold] Wrote test stub: test_%s.js", self.game_key)
+""")
+
+# SHARED_MODULES never varies, so its JSON is encoded once and spliced in.
+_SHARED_MODULES_JSON = json.dumps(SHARED_MODULES, indent=2).replace('\n', '\n  ')
+_MANIFEST_TPL = string.Template("""{
+  "key": ${key},
+  "name": ${name},
+  "dir": ${dir},
+  "grid_size": ${grid_size},
+  "tick_rate": ${tick_rate},
+  "shared_modules": """ + _SHARED_MODULES_JSON + """,
+  "optional_modules": ${optional_modules}
+}
+""")
+
+# ─── File writer ────────────────────────────────────────────────────────────
+
+_FileSpec = tuple[Path, str, int]
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+
+def _bulk_write(items: list[_FileSpec]) -> None:
+    """Write every ``(path, content, mode)`` in one pass over raw fds."""
+    trace = logger.isEnabledFor(logging.DEBUG)  # checked once, not per file
+    for path, content, mode in items:
+        data = memoryview(content.encode('utf-8'))
+        fd = os.open(path, _WRITE_FLAGS, mode)
+        try:
+            if mode & 0o111:
+                os.fchmod(fd, mode)  # O_CREAT honours umask and skips existing files
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        if trace:
+            logger.debug("[Scaffold] Wrote %s", path.name)
+
+
+_REQUIRED_FILES = frozenset(REQUIRED_FILES)
+
+
+@lru_cache(maxsize=256)
+def _render_index_html(game_key: str, display_name: str, game_cls: str,
+                       optional_modules: tuple[str, ...], bundle: bool = False) -> str:
+    """index.html for one game; cached so overwrite re-runs skip the render."""
+    script_tags = _BUNDLE_TAG if bundle else _SCRIPT_TAGS_BLOCK
+    # Add optional modules if requested
+    if optional_modules and not bundle:
+        opt_tags = '\n'.join(_SCRIPT_TAG.format(module=m) for m in optional_modules)
+        script_tags += '\n\n    <!-- Optional shared modules -->\n' + opt_tags
+    return _HTML_TPL.substitute(
+        display_name=display_name,
+        script_tags=script_tags,
+        game_key=game_key,
+        game_cls=game_cls,
+    )
+
+
+def _dir_names(path: str) -> set:
+    """Entry names in path via one scandir; empty if it is not a directory."""
+    try:
+        with os.scandir(path) as it:
+            return {e.name for e in it}
+    except OSError:
+        return set()
+
+
+class GameScaffold:
+    """Generates a new game directory from the QuadCraft template."""
+
+    def __init__(self, game_key: str, display_name: str, *,
+                 grid_size: int = 8, tick_rate: int = 16,
+                 optional_modules: list[str] | None = None,
+                 bundle: bool = False):
+        self.game_key = game_key
+        self.display_name = display_name
+        self.grid_size = grid_size
+        self.tick_rate = tick_rate
+        self.optional_modules = optional_modules or []
+        self.bundle = bundle
+        self.dir_name = f"4d_{game_key}"
+        # CamelCase stem shared by every generated class name
+        self._name_prefix = ''.join(p.capitalize() for p in game_key.split('_'))
+        self.game_dir = Path(GAMES_DIR) / self.dir_name
+        # Validate optional module names
+        valid = set(OPTIONAL_SHARED_MODULES)
+        invalid = [m for m in self.optional_modules if m not in valid]
+        if invalid:
+            raise ValueError(f"Unknown optional modules: {invalid}. Valid: {sorted(valid)}")
+        logger.info("[Scaffold] Initialized for %s → %s (optional: %s)",
+                    game_key, self.game_dir, self.optional_modules or 'none')
+
+    # ── Public API ───────────────────────────────────────────────────────────
+
+    def create(self, *, overwrite: bool = False) -> Path:
+        """Create the full game directory structure. Returns the path."""
+        if self.game_dir.exists() and not overwrite:
+            raise FileExistsError(f"Directory already exists: {self.game_dir}")
+
+        js_dir = self.game_dir / "js"
+        tests_dir = self.game_dir / "tests"
+        names = {
+            'board': self._class_name('Board'),
+            'renderer': self._class_name('Renderer'),
+            'game': self._class_name('Game'),
+        }
+        files = [
+            self._render_board(js_dir, names),
+            self._render_renderer(js_dir, names),
+            self._render_game(js_dir, names),
+            self._render_html(names),
+            self._render_run_sh(),
+            self._render_agents_md(),
+            self._render_manifest(),
+            self._render_test_stub(tests_dir, names),
+            *([self._render_bundle(js_dir)] if self.bundle else []),
+        ]
+        # Everything is rendered (a missing bundle module raises above), so
+        # no half-built directory is left behind on failure
+        js_dir.mkdir(parents=True, exist_ok=True)
+        tests_dir.mkdir(exist_ok=True)
+        _bulk_write(files)
+
+        logger.info("[Scaffold] Created game: %s at %s (%d files)",
+                    self.display_name, self.game_dir, len(files))
+        return self.game_dir
+
+    def validate(self) -> list:
+        """Check that all required files exist. Returns list of issues."""
+        base = str(self.game_dir)
+        root_names = _dir_names(base)
+        js_names = _dir_names(os.path.join(base, "js"))
+        missing = _REQUIRED_FILES - root_names
+        # Report in REQUIRED_FILES order; the set only decides whether to look
+        issues = [f"Missing required file: {f}" for f in REQUIRED_FILES if f in missing] if missing else []
+        issues += [f"Missing JS module: js/{n}"
+                   for n in (f"{self.game_key}_board.js",
+                             f"{self.game_key}_renderer.js",
+                             f"{self.game_key}_game.js")
+                   if n not in js_names]
+        if issues:
+            logger.warning("[Scaffold] Validation issues: %s", issues)
+        return issues
+
+    # ── Private generators ───────────────────────────────────────────────────
+
+    def _class_name(self, suffix: str) -> str:
+        return self._name_prefix + suffix
+
+    def _render_board(self, js_dir: Path, names: dict[str, str]) -> _FileSpec:
+        content = _BOARD_TPL.substitute(
+            game_key=self.game_key,
+            display_name=self.display_name,
+            cls=names['board'],
+            grid_size=self.grid_size,
+        )
+        return js_dir / f"{self.game_key}_board.js", content, 0o644
+
+    def _render_renderer(self, js_dir: Path, names: dict[str, str]) -> _FileSpec:
+        content = _RENDERER_TPL.substitute(
+            game_key=self.game_key,
+            display_name=self.display_name,
+            cls=names['renderer'],
+        )
+        return js_dir / f"{self.game_key}_renderer.js", content, 0o644
+
+    def _render_game(self, js_dir: Path, names: dict[str, str]) -> _FileSpec:
+        content = _GAME_TPL.substitute(
+            game_key=self.game_key,
+            display_name=self.display_name,
+            cls=names['game'],
+            board_cls=names['board'],
+            renderer_cls=names['renderer'],
+            tick_rate=self.tick_rate,
+        )
+        return js_dir / f"{self.game_key}_game.js", content, 0o644
+
+    def _render_html(self, names: dict[str, str]) -> _FileSpec:
+        content = _render_index_html(self.game_key, self.display_name, names['game'],
+                                     tuple(self.optional_modules), self.bundle)
+        return self.game_dir / "index.html", content, 0o644
+
+    def _render_bundle(self, js_dir: Path) -> _FileSpec:
+        """Concatenate the shared (and optional) modules into js/shared_bundle.js."""
+        parts = []
+        for module in [*SHARED_MODULES, *self.optional_modules]:
+            src = resolve_module_path(module)
+            if src is None:
+                raise FileNotFoundError(f"Shared module not found in {GENERIC_DIR}: {module}")
+            parts.append(f"// ── 4d_generic/{module} ──\n"
+                         + src.read_text(encoding="utf-8").rstrip('\n') + '\n')
+        return js_dir / _BUNDLE_NAME, '\n'.join(parts), 0o644
+
+    def _render_run_sh(self) -> _FileSpec:
+        content = _RUN_SH_TPL.substitute(display_name=self.display_name)
+        return self.game_dir / "run.sh", content, 0o755
+
+    def _render_agents_md(self) -> _FileSpec:
+        modules_md = _SHARED_MODULES_MD
+        if self.optional_modules:
+            modules_md += ', ' + ', '.join('`' + m + '`' for m in self.optional_modules)
+        content = _AGENTS_MD_TPL.substitute(
+            display_name=self.display_name,
+            game_key=self.game_key,
+            modules_md=modules_md,
+        )
+        return self.game_dir / "AGENTS.md", content, 0o644
+
+    def _render_manifest(self) -> _FileSpec:
+        content = _MANIFEST_TPL.substitute(
+            key=json.dumps(self.game_key),
+            name=json.dumps(self.display_name),
+            dir=json.dumps(self.dir_name),
+            grid_size=json.dumps(self.grid_size),
+            tick_rate=json.dumps(self.tick_rate),
+            optional_modules=json.dumps(self.optional_modules, indent=2).replace('\n', '\n  '),
+        )
+        return self.game_dir / "manifest.json", content, 0o644
+
+    def _render_test_stub(self, tests_dir: Path, names: dict[str, str]) -> _FileSpec:
+        content = _TEST_STUB_TPL.substitute(
+            game_key=self.game_key,
+            display_name=self.display_name,
+            board_cls=names['board'],
+            grid_size=self.grid_size,
+        )
+        return tests_dir / f"test_{self.game_key}.js", content, 0o644
+
+
+def create_many(specs: list[tuple[str, str]], *, overwrite: bool = False) -> list[Path]:
+    """Scaffold several games at once from (game_key, display_name) pairs.
+
+    Each game writes only to its own directory, so creates run on a thread
+    pool. Returns the created paths in spec order.
+    """
+    scaffolds = [GameScaffold(key, name) for key, name in specs]
+    if not scaffolds:
+        return []
+    with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(scaffolds))) as pool:
+        return list(pool.map(lambda s: s.create(overwrite=overwrite), scaffolds))
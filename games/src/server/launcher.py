@@ -3,14 +3,14 @@ games.src.launcher — HTTP game server and browser launcher.
 
 Serves individual game directories over HTTP with the games/ root as
 the document root, so that '../4d_generic/' imports resolve correctly.
+
+http.server, socketserver, subprocess and platform are imported on first
+use, so importing this module (e.g. for validation or test runs) stays cheap.
 """
 
-import http.server
+import functools
 import logging
 import os
-import platform
-import socketserver
-import subprocess
 import threading
 import time
 from pathlib import Path
@@ -18,29 +18,69 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
-from ..core.registry import GAMES
+from ..core.registry import GAMES, GAME_META, GameMeta
+
+# Servers started with batch_browser=True (e.g. from a thread pool) queue
+# their URLs here; open_urls_batch() opens them together once all are up.
+_pending_urls: list[str] = []
+_PENDING_LOCK = threading.Lock()
+BROWSER_OPEN_INTERVAL = 0.05  # seconds between launches where one call can't take many URLs
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Quiet HTTP handler (no per-request logging)
+# Quiet HTTP handler (no per-request logging) and server class, built lazily
 # ─────────────────────────────────────────────────────────────────────────────
-class QuietHTTPHandler(http.server.SimpleHTTPRequestHandler):
-    """HTTP handler that suppresses per-request log output."""
-    def log_message(self, format: str, *args: Any) -> None:
-        pass  # Suppress output
+@functools.cache
+def _handler_class() -> type:
+    import http.server
+
+    class QuietHTTPHandler(http.server.SimpleHTTPRequestHandler):
+        """HTTP handler that suppresses per-request log output."""
+        def log_message(self, *args: Any, **kwargs: Any) -> None:
+            return  # Suppress output
+
+    return QuietHTTPHandler
+
+
+@functools.cache
+def _server_class() -> type:
+    import socketserver
+
+    class ReusableTCPServer(socketserver.TCPServer):
+        """TCPServer that allows address reuse, avoiding "Address already in use" on quick restarts."""
+        allow_reuse_address = True
+
+    return ReusableTCPServer
+
+
+_LAZY_CLASSES = {"QuietHTTPHandler": _handler_class, "ReusableTCPServer": _server_class}
+
+
+def __getattr__(name: str) -> type:
+    if name in _LAZY_CLASSES:
+        return _LAZY_CLASSES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Game Server — serves one game on one port
 # ─────────────────────────────────────────────────────────────────────────────
 class GameServer:
-    """Serves a single game directory over HTTP."""
+    """Serves a single game directory over HTTP.
+
+    With open_browser, start() opens the game in the browser. Pass
+    batch_browser=True to queue the URL instead and open every queued URL
+    with one open_urls_batch() call after starting a group of servers.
+    """
 
-    def __init__(self, game_key: str, base_port: int, games_dir: Path, open_browser: bool = True) -> None:
-        meta = GAMES[game_key]
+    def __init__(self, game_key: str, base_port: int, games_dir: Path,
+                 open_browser: bool = True, batch_browser: bool = False) -> None:
+        # GAME_META is an import-time snapshot; keys registered later live only in GAMES
+        meta = GAME_META.get(game_key) or GameMeta(**GAMES[game_key])
         self.key = game_key
-        self.name = meta["name"]
-        self.port = base_port + meta["port_offset"]
-        self.game_dir = games_dir / meta["dir"]
+        self.name = meta.name
+        self.port = base_port + meta.port_offset
+        self.game_dir = games_dir / meta.dir
         self.open_browser = open_browser
+        self.batch_browser = batch_browser
         self.server = None
         self.thread = None
 
@@ -59,34 +99,38 @@ class GameServer:
         # SERVE FROM ROOT ("games/") so that "../4d_generic" imports work
         root_dir = self.game_dir.parent 
         
-        current_dir = os.getcwd()
-        try:
-            os.chdir(root_dir)
-            handler = lambda *args, **kwargs: QuietHTTPHandler(*args, directory=str(root_dir), **kwargs)
+        if not self._bind(root_dir):
+            return False
 
-            # Allow address reuse to avoid "Address already in use" errors on quick restarts
-            socketserver.TCPServer.allow_reuse_address = True
-            try:
-                self.server = socketserver.TCPServer(("127.0.0.1", self.port), handler)
-            except OSError as e:
-                logger.error("[Launcher] %s: port %d unavailable: %s", self.name, self.port, e)
-                print(f"  ⚠️  {self.name}: port {self.port} unavailable ({e})")
-                return False
-
-            self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
-            self.thread.start()
-            logger.info("[Launcher] %s started on port %d", self.name, self.port)
-
-            # URL includes the game directory name relative to games/ root
-            rel_path = self.game_dir.name
-            url = f"http://127.0.0.1:{self.port}/{rel_path}/index.html"
-            print(f"  ✅ {self.name:20s} → {url}")
-
-            if self.open_browser:
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info("[Launcher] %s started on port %d", self.name, self.port)
+
+        # URL includes the game directory name relative to games/ root
+        rel_path = self.game_dir.name
+        url = f"http://127.0.0.1:{self.port}/{rel_path}/index.html"
+        print(f"  ✅ {self.name:20s} → {url}")
+
+        if self.open_browser:
+            if self.batch_browser:
+                # Opened by open_urls_batch(), which the caller runs after start()
+                with _PENDING_LOCK:
+                    _pending_urls.append(url)
+            else:
                 open_url(url)
-            return True
-        finally:
-            os.chdir(current_dir)
+        return True
+
+    def _bind(self, root_dir: Path) -> bool:
+        """Create the TCP server for root_dir. Returns False if the port is taken."""
+        # The handler serves from `directory`, so the process cwd never changes
+        handler = functools.partial(_handler_class(), directory=str(root_dir))
+        try:
+            self.server = _server_class()(("127.0.0.1", self.port), handler)
+        except OSError as e:
+            logger.error("[Launcher] %s: port %d unavailable: %s", self.name, self.port, e)
+            print(f"  ⚠️  {self.name}: port {self.port} unavailable ({e})")
+            return False
+        return True
 
     def stop(self) -> None:
         """Shut down the server."""
@@ -95,15 +139,53 @@ class GameServer:
             self.server.server_close()
             logger.info("[Launcher] %s stopped", self.name)
 
-def open_url(url: str) -> None:
-    """Open a URL in the default browser (platform-aware)."""
+def open_urls_batch() -> None:
+    """Open every URL queued by GameServer.start(batch_browser=True).
+
+    macOS takes all URLs in one `open` call. xdg-open and os.startfile take
+    one URL each, so those run from a background thread, spaced by
+    BROWSER_OPEN_INTERVAL.
+    """
+    with _PENDING_LOCK:
+        urls = _pending_urls[:]
+        _pending_urls.clear()
+    _open_urls(urls)
+
+
+def _open_urls(urls: list[str]) -> None:
+    import platform
+    import subprocess
+
+    if not urls:
+        return
+
     system = platform.system()
-    try:
-        if system == "Darwin":
-            subprocess.Popen(["open", url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        elif system == "Linux":
+    if system == "Darwin":
+        try:
+            subprocess.Popen(["open", *urls], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except Exception:
+            pass  # Browser open is best-effort
+        return
+
+    if system == "Linux":
+        def open_one(url: str) -> None:
             subprocess.Popen(["xdg-open", url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        elif system == "Windows":
-            os.startfile(url)
-    except Exception:
-        pass  # Browser open is best-effort
+    elif system == "Windows":
+        open_one = os.startfile
+    else:
+        return
+
+    def open_all() -> None:
+        for url in urls:
+            try:
+                open_one(url)
+            except Exception:
+                pass  # Browser open is best-effort
+            time.sleep(BROWSER_OPEN_INTERVAL)
+
+    threading.Thread(target=open_all, daemon=True).start()
+
+
+def open_url(url: str) -> None:
+    """Open a URL in the default browser (platform-aware)."""
+    _open_urls([url])
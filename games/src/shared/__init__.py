@@ -12,10 +12,13 @@ Usage:
         print(mod.name, mod.path)
 """
 
+import heapq
 import logging
+import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from ..core.config import GENERIC_DIR, SHARED_MODULES
 
@@ -24,35 +27,62 @@ logger = logging.getLogger(__name__)
 
 # ─── Module metadata ────────────────────────────────────────────────────────
 
-@dataclass
+_UNSET = object()
+
+
+@dataclass(slots=True)
 class JSModule:
-    """Metadata for a shared JavaScript module."""
+    """Metadata for a shared JavaScript module.
+
+    ``path``/``exists``/``subfolder`` are probed once per instance; call
+    ``invalidate()`` after files in 4d_generic/ change.
+    """
     name: str
     filename: str
     category: str
     description: str
     depends_on: List[str] = field(default_factory=list)
 
+    # Probe caches live in slots (no per-instance __dict__ for cached_property)
+    _path: Optional[Path] = field(default=None, init=False, repr=False, compare=False)
+    _exists: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    _subfolder: object = field(default=_UNSET, init=False, repr=False, compare=False)
+
+    _generic_dir: ClassVar[str] = str(GENERIC_DIR)
+
     @property
     def path(self) -> Path:
-        return Path(GENERIC_DIR) / self.filename
+        if self._path is None:
+            self._path = Path(self._generic_dir, self.filename)
+        return self._path
 
     @property
     def exists(self) -> bool:
-        return self.path.exists()
+        if self._exists is None:
+            self._exists = os.path.exists(os.path.join(self._generic_dir, self.filename))
+        return self._exists
 
     @property
     def subfolder(self) -> Optional[str]:
         """Returns 'js' if in js/ subfolder, else None."""
-        if not self.exists:
-            js_path = Path(GENERIC_DIR) / "js" / self.filename
-            if js_path.exists():
-                return "js"
-        return None
+        if self._subfolder is _UNSET:
+            self._subfolder = None
+            if not self.exists:
+                if os.path.exists(os.path.join(self._generic_dir, "js", self.filename)):
+                    self._subfolder = "js"
+        return self._subfolder
+
+    def invalidate(self) -> None:
+        """Drop the memoized filesystem probes so the next read re-stats."""
+        self._path = None
+        self._exists = None
+        self._subfolder = _UNSET
 
 
 # ─── Module registry ────────────────────────────────────────────────────────
 
+_SEPARATOR = "─" * 50
+
 # Canonical module definitions with dependency ordering
 _MODULE_DEFS = [
     JSModule("Quadray", "quadray.js", "math",
@@ -112,6 +142,13 @@ class ModuleRegistry:
 
     def __init__(self):
         self._modules = {m.filename: m for m in _MODULE_DEFS}
+        self._load_order = self._topo_sort()
+        self._by_cat: dict = {}
+        for m in self._modules.values():
+            self._by_cat.setdefault(m.category, []).append(m)
+        self._categories = sorted(self._by_cat)
+        self._report_sig: Optional[frozenset] = None
+        self._report = ""
         logger.info("[ModuleRegistry] Loaded %d module definitions", len(self._modules))
 
     def get(self, filename: str) -> Optional[JSModule]:
@@ -124,58 +161,107 @@ class ModuleRegistry:
 
     def by_category(self, category: str) -> List[JSModule]:
         """Filter modules by category (math, rendering, input, engine, ui)."""
-        return [m for m in self._modules.values() if m.category == category]
+        return list(self._by_cat.get(category, ()))
 
     def categories(self) -> List[str]:
         """All distinct categories."""
-        return sorted(set(m.category for m in self._modules.values()))
+        return list(self._categories)
 
     def load_order(self) -> List[JSModule]:
         """Modules in dependency-safe load order (topological sort)."""
-        visited = set()
-        order = []
+        return list(self._load_order)
 
-        def visit(filename):
-            if filename in visited:
-                return
-            visited.add(filename)
-            mod = self._modules.get(filename)
-            if mod:
-                for dep in mod.depends_on:
-                    visit(dep)
-                order.append(mod)
+    def _topo_sort(self) -> List[JSModule]:
+        """Iterative Kahn sort; ties resolve in declaration order."""
+        mods = list(self._modules.values())
+        index = {m.filename: i for i, m in enumerate(mods)}
+        indeg = [0] * len(mods)
+        rdeps: List[List[int]] = [[] for _ in mods]
+        for i, m in enumerate(mods):
+            for dep in set(m.depends_on):
+                j = index.get(dep)
+                if j is not None:  # unknown deps are external, not ordering edges
+                    indeg[i] += 1
+                    rdeps[j].append(i)
 
-        for filename in self._modules:
-            visit(filename)
+        ready = [i for i, n in enumerate(indeg) if n == 0]
+        order = []
+        while ready:
+            i = heapq.heappop(ready)
+            order.append(mods[i])
+            for k in rdeps[i]:
+                indeg[k] -= 1
+                if indeg[k] == 0:
+                    heapq.heappush(ready, k)
 
+        if len(order) < len(mods):
+            stuck = [m for i, m in enumerate(mods) if indeg[i] > 0]
+            logger.warning("[ModuleRegistry] Dependency cycle among: %s",
+                           [m.filename for m in stuck])
+            order.extend(stuck)
         return order
 
     def missing_modules(self) -> List[JSModule]:
         """Modules defined but not present on disk."""
         return [m for m in self._modules.values() if not m.exists]
 
+    @staticmethod
+    def _scan_present() -> set:
+        """Filenames in 4d_generic/ (and ``js/<name>`` in its js/), one scandir each."""
+        base = JSModule._generic_dir
+        out = set()
+        try:
+            with os.scandir(base) as it:
+                out.update(e.name for e in it if e.is_file())
+            with os.scandir(os.path.join(base, "js")) as it:
+                out.update("js/" + e.name for e in it if e.is_file())
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        return out
+
     def coverage_report(self) -> str:
         """Report on module presence and categories."""
-        lines = ["Module Coverage Report", "─" * 50]
-        for cat in self.categories():
-            mods = self.by_category(cat)
+        on_disk = frozenset(self._scan_present())
+        if on_disk == self._report_sig:
+            return self._report
+        lines = ["Module Coverage Report", _SEPARATOR]
+        for cat in self._categories:
             lines.append(f"\n  [{cat.upper()}]")
-            for m in mods:
-                icon = "✅" if m.exists else "❌"
+            for m in self._by_cat[cat]:
+                icon = "✅" if m.filename in on_disk else "❌"
                 lines.append(f"    {icon} {m.name} ({m.filename})")
-        present = sum(1 for m in self._modules.values() if m.exists)
+        present = sum(1 for m in self._modules.values() if m.filename in on_disk)
         total = len(self._modules)
         lines.append(f"\nCoverage: {present}/{total} ({present/total*100:.0f}%)")
-        return '\n'.join(lines)
+        self._report_sig, self._report = on_disk, '\n'.join(lines)
+        return self._report
+
+
+def _mtime_ns(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+@lru_cache(maxsize=1)
+def _resolution_table(base: str, mtime_ns: int, js_mtime_ns: int) -> dict:
+    """filename -> Path for 4d_generic/ then its js/; top level wins on clashes."""
+    table = {}
+    for folder in (base, os.path.join(base, "js")):
+        try:
+            with os.scandir(folder) as it:
+                for e in it:
+                    if e.is_file():
+                        table.setdefault(e.name, Path(e.path))
+        except OSError:
+            pass
+    return table
 
 
 def resolve_module_path(filename: str) -> Optional[Path]:
     """Resolve a shared module filename to its absolute path."""
-    p = Path(GENERIC_DIR) / filename
-    if p.exists():
-        return p
-    # Check js/ subfolder
-    p2 = Path(GENERIC_DIR) / "js" / filename
-    if p2.exists():
-        return p2
-    return None
+    base = str(GENERIC_DIR)
+    # Keyed on both directory mtimes, so adding/removing a module rescans
+    table = _resolution_table(base, _mtime_ns(base), _mtime_ns(os.path.join(base, "js")))
+    return table.get(filename)
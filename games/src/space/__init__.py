@@ -17,34 +17,46 @@ Usage:
     print(q, cart, IVM.TETRA_VOL)
 """
 
-from .quadrays import Quadray
-from .ivm import IVM, SYNERGETICS, IVMGrid, Jitterbug
+from .quadrays import Quadray, QuadrayArray
+from .ivm import (
+    IVM, SYNERGETICS, IVMGrid, Jitterbug,
+    volume_xyz_to_ivm, volume_ivm_to_xyz,
+    volume_xyz_to_ivm_batch, volume_ivm_to_xyz_batch,
+)
 from .xyz import (
     quadray_to_xyz, xyz_to_quadray,
     project_quadray, rotate_xyz,
+    project_quadray_batch, rotate_xyz_batch,
     ScreenPoint, project_basis_axes,
 )
 from .geometry import (
     angle_between, distance, manhattan_4d, euclidean_4d,
     verify_round_trip, verify_geometric_identities,
-    generate_grid, neighbors, bounded_neighbors,
-    in_bounds, depth_sort, random_coord,
+    generate_grid, generate_grid_array, iter_grid, iter_grid_coords,
+    neighbors, bounded_neighbors,
+    neighbors_array, bounded_neighbors_array, bounded_neighbor_indices,
+    in_bounds, depth_sort, depth_sort_array, DepthOrder, random_coord,
     CheckResult, VerificationReport,
 )
 
 __all__ = [
     # Quadray
-    "Quadray",
+    "Quadray", "QuadrayArray",
     # IVM
     "IVM", "SYNERGETICS", "IVMGrid", "Jitterbug",
+    "volume_xyz_to_ivm", "volume_ivm_to_xyz",
+    "volume_xyz_to_ivm_batch", "volume_ivm_to_xyz_batch",
     # XYZ
     "quadray_to_xyz", "xyz_to_quadray",
     "project_quadray", "rotate_xyz",
+    "project_quadray_batch", "rotate_xyz_batch",
     "ScreenPoint", "project_basis_axes",
     # Geometry
     "angle_between", "distance", "manhattan_4d", "euclidean_4d",
     "verify_round_trip", "verify_geometric_identities",
     "CheckResult", "VerificationReport",
-    "generate_grid", "neighbors", "bounded_neighbors",
-    "in_bounds", "depth_sort", "random_coord",
+    "generate_grid", "generate_grid_array", "iter_grid", "iter_grid_coords",
+    "neighbors", "bounded_neighbors",
+    "neighbors_array", "bounded_neighbors_array", "bounded_neighbor_indices",
+    "in_bounds", "depth_sort", "depth_sort_array", "DepthOrder", "random_coord",
 ]
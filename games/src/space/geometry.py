@@ -8,19 +8,32 @@ Provides:
     • verify_round_trip       — Quadray↔XYZ round-trip fidelity
     • verify_geometric_identities — 8-check Synergetics verification suite
     • generate_grid           — full 4D IVM grid cell generation
+    • iter_grid / iter_grid_coords — the same cells, streamed lazily
+    • generate_grid_array     — the same grid as an (N, 4) NumPy array
     • neighbors / bounded_neighbors / in_bounds — adjacency
+    • neighbors_array / bounded_neighbors_array — adjacency as (k, 4) arrays
+    • bounded_neighbor_indices — adjacency as packed linear cell indices
     • depth_sort              — painter's-algorithm depth ordering
+    • depth_sort_array        — the same ordering as parallel NumPy arrays
 """
 
 from __future__ import annotations
 
+import itertools
 import logging
 import math
 import random
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Callable
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, Callable
 
-from .quadrays import Quadray, ROOT2, S3
+# NumPy is an optional accelerator for the batch (array) APIs.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .quadrays import Quadray, QuadrayArray, ROOT2, S3
 from .ivm import SYNERGETICS
 
 logger = logging.getLogger(__name__)
@@ -37,14 +50,12 @@ def angle_between(q1: Quadray, q2: Quadray) -> float:
     """
     x1, y1, z1 = q1.to_xyz()
     x2, y2, z2 = q2.to_xyz()
+    # atan2(|u×v|, u·v): stable near 0°/180°, no clamp, 0.0 for a zero vector
+    cx = y1 * z2 - z1 * y2
+    cy = z1 * x2 - x1 * z2
+    cz = x1 * y2 - y1 * x2
     dot = x1 * x2 + y1 * y2 + z1 * z2
-    mag1 = math.sqrt(x1**2 + y1**2 + z1**2)
-    mag2 = math.sqrt(x2**2 + y2**2 + z2**2)
-    if mag1 == 0 or mag2 == 0:
-        return 0.0
-
-    cos_angle = max(-1.0, min(1.0, dot / (mag1 * mag2)))
-    return math.degrees(math.acos(cos_angle))
+    return math.degrees(math.atan2(math.sqrt(cx * cx + cy * cy + cz * cz), dot))
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -64,10 +75,11 @@ def manhattan_4d(q1: Quadray, q2: Quadray) -> float:
 
 def euclidean_4d(q1: Quadray, q2: Quadray) -> float:
     """4-component Euclidean distance (raw, not via Cartesian)."""
-    return math.sqrt(
-        (q1.a - q2.a)**2 + (q1.b - q2.b)**2
-        + (q1.c - q2.c)**2 + (q1.d - q2.d)**2
-    )
+    da = q1.a - q2.a
+    db = q1.b - q2.b
+    dc = q1.c - q2.c
+    dd = q1.d - q2.d
+    return math.sqrt(da * da + db * db + dc * dc + dd * dd)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -124,6 +136,9 @@ def verify_round_trip(q: Quadray, tolerance: float = 0.01) -> CheckResult:
 def verify_geometric_identities(tolerance: float = 0.01) -> VerificationReport:
     """Run all 8 Synergetics geometry checks (mirrors verifyGeometricIdentities JS).
 
+    The checks are deterministic, so they run once per tolerance; each call
+    gets a report of fresh CheckResult copies it may mutate.
+
     Checks:
         1. Basis vector lengths         ≈ 0.7071
         2. Tetrahedral angles           ≈ 109.47°
@@ -134,6 +149,15 @@ def verify_geometric_identities(tolerance: float = 0.01) -> VerificationReport:
         7. S3 constant validation        √(9/8)
         8. Volume ratios                 1:4:20
     """
+    report = VerificationReport([replace(c) for c in _identity_checks(tolerance)])
+    logger.info("[Geometry] Verification: %d/%d passed",
+                report.pass_count, len(report.checks))
+    return report
+
+
+@lru_cache(maxsize=8)
+def _identity_checks(tolerance: float) -> Tuple[CheckResult, ...]:
+    """Build the 8 CheckResults for one tolerance (cached; never mutate)."""
     report = VerificationReport()
 
     # 1. Basis vector lengths
@@ -231,9 +255,7 @@ def verify_geometric_identities(tolerance: float = 0.01) -> VerificationReport:
                 and SYNERGETICS.CUBO_VOL // SYNERGETICS.TETRA_VOL == 20),
     ))
 
-    logger.info("[Geometry] Verification: %d/%d passed",
-                report.pass_count, len(report.checks))
-    return report
+    return tuple(report.checks)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -248,19 +270,46 @@ DIRECTIONS = [
     (2, 0, 1, 1), (2, 1, 0, 1), (2, 1, 1, 0)
 ]
 
+# Read-only (12, 4) copy of DIRECTIONS for the array neighbour APIs
+if np is not None:
+    DIR_ARR = np.array(DIRECTIONS, dtype=np.int32)
+    DIR_ARR.flags.writeable = False
+else:
+    DIR_ARR = None
+
 
-def generate_grid(size: int) -> List[Quadray]:
+def generate_grid(size: int, *, materialize: bool = True):
     """Generate all cells in a size⁴ Quadray integer grid.
 
-    Returns size⁴ Quadray instances with integer components ∈ [0, size).
+    Returns size⁴ Quadray instances with integer components ∈ [0, size),
+    in (a, b, c, d) lexicographic order.  With ``materialize=False`` the
+    grid is returned as the ``generate_grid_array`` ndarray instead.
+    """
+    if not materialize:
+        return generate_grid_array(size)
+    return list(iter_grid(size))
+
+
+def iter_grid_coords(size: int) -> Iterator[Tuple[int, int, int, int]]:
+    """Lazily yield (a, b, c, d) integer tuples in generate_grid order."""
+    return itertools.product(range(size), repeat=4)
+
+
+def iter_grid(size: int) -> Iterator[Quadray]:
+    """Lazily yield generate_grid's Quadrays without holding all size⁴."""
+    # float components up front so Quadray._unchecked can skip float()
+    return itertools.starmap(Quadray._unchecked,
+                             itertools.product(map(float, range(size)), repeat=4))
+
+
+def generate_grid_array(size: int):
+    """size⁴ grid as an (N, 4) int32 array, rows in generate_grid order.
+
+    Requires NumPy.
     """
-    cells = []
-    for a in range(size):
-        for b in range(size):
-            for c in range(size):
-                for d in range(size):
-                    cells.append(Quadray(a, b, c, d))
-    return cells
+    if np is None:
+        raise ImportError("generate_grid_array requires numpy")
+    return np.indices((size,) * 4, dtype=np.int32).reshape(4, -1).T.copy()
 
 
 def in_bounds(a: int, b: int, c: int, d: int, size: int) -> bool:
@@ -270,21 +319,50 @@ def in_bounds(a: int, b: int, c: int, d: int, size: int) -> bool:
 
 def neighbors(a: int, b: int, c: int, d: int) -> List[Quadray]:
     """Return the 12 kissing neighbours (unbounded)."""
-    return [
-        Quadray(a + da, b + db, c + dc, d + dd)
-        for da, db, dc, dd in DIRECTIONS
-    ]
+    a, b, c, d = float(a), float(b), float(c), float(d)
+    new = Quadray._unchecked
+    return [new(a + da, b + db, c + dc, d + dd) for da, db, dc, dd in DIRECTIONS]
 
 
 def bounded_neighbors(a: int, b: int, c: int, d: int, size: int) -> List[Quadray]:
     """Return only in-bounds face-touching neighbours."""
+    # in_bounds inlined: saves a function call per direction
+    a, b, c, d = float(a), float(b), float(c), float(d)
+    new = Quadray._unchecked
     return [
-        Quadray(a + da, b + db, c + dc, d + dd)
+        new(a + da, b + db, c + dc, d + dd)
         for da, db, dc, dd in DIRECTIONS
-        if in_bounds(a + da, b + db, c + dc, d + dd, size)
+        if 0 <= a + da < size and 0 <= b + db < size
+        and 0 <= c + dc < size and 0 <= d + dd < size
     ]
 
 
+def neighbors_array(a: int, b: int, c: int, d: int):
+    """The 12 kissing neighbours as a (12, 4) int32 array (unbounded).
+
+    Rows follow DIRECTIONS order, like neighbors().  Requires NumPy.
+    """
+    if np is None:
+        raise ImportError("neighbors_array requires numpy")
+    return DIR_ARR + np.array((a, b, c, d), dtype=np.int32)
+
+
+def bounded_neighbors_array(a: int, b: int, c: int, d: int, size: int):
+    """In-bounds neighbours as a (k, 4) int32 array; one boolean mask."""
+    out = neighbors_array(a, b, c, d)
+    return out[((out >= 0) & (out < size)).all(axis=1)]
+
+
+def bounded_neighbor_indices(a: int, b: int, c: int, d: int, size: int):
+    """In-bounds neighbours as int32 linear indices a·size³ + b·size² + c·size + d.
+
+    Indices match generate_grid / generate_grid_array row order, so a
+    BFS or flood fill can track visits in a flat ``size**4`` bool array.
+    """
+    valid = bounded_neighbors_array(a, b, c, d, size)
+    return np.ravel_multi_index(valid.T, (size,) * 4).astype(np.int32)
+
+
 def depth_sort(
     cells: List[Quadray],
     project_fn: Optional[Callable] = None,
@@ -297,6 +375,10 @@ def depth_sort(
 
     Returns list of dicts: {'quadray': Quadray, 'px': x, 'py': y, 'pscale': scale}.
     """
+    if project_fn is None and isinstance(cells, QuadrayArray):
+        # Packing a Quadray list costs more than the Python sort saves,
+        # so only already-packed batches take the vectorised path.
+        return depth_sort_array(cells).to_dicts()
     results = []
     for q in cells:
         if project_fn:
@@ -318,6 +400,48 @@ def depth_sort(
     return results
 
 
+@dataclass
+class DepthOrder:
+    """depth_sort result as parallel arrays, already in painter's order.
+
+    ``order`` indexes the input cells; ``px``/``py``/``pscale`` are the
+    projected values of the sorted cells.
+    """
+    cells: object
+    order: object
+    px: object
+    py: object
+    pscale: object
+
+    def to_dicts(self) -> List[dict]:
+        """The list-of-dicts shape returned by depth_sort."""
+        cells = self.cells
+        return [
+            {"quadray": cells[i], "px": x, "py": y, "pscale": s}
+            for i, x, y, s in zip(self.order.tolist(), self.px.tolist(),
+                                  self.py.tolist(), self.pscale.tolist())
+        ]
+
+
+def depth_sort_array(cells) -> DepthOrder:
+    """Vectorised depth_sort (sum heuristic) over Quadrays or a QuadrayArray.
+
+    Stable, like depth_sort, so equal-depth cells keep their input order.
+    Requires NumPy.
+    """
+    if np is None:
+        raise ImportError("depth_sort_array requires numpy")
+    if not isinstance(cells, QuadrayArray):
+        cells = list(cells)
+    coords = (cells.coords if isinstance(cells, QuadrayArray)
+              else QuadrayArray.from_iterable(cells).coords)
+    a, b, c, d = coords.T
+    pscale = ((a + b) + c) + d  # same summation order as q.a + q.b + q.c + q.d
+    order = np.argsort(pscale, kind="stable")
+    return DepthOrder(cells=cells, order=order,
+                      px=(a - b)[order], py=(c - d)[order], pscale=pscale[order])
+
+
 def random_coord(size: int) -> Quadray:
     """Return a random Quadray with integer components ∈ [0, size)."""
     return Quadray(
@@ -16,6 +16,12 @@ import logging
 import math
 from dataclasses import dataclass
 
+# NumPy is an optional accelerator for the batch conversions.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +31,31 @@ logger = logging.getLogger(__name__)
 
 ROOT2: float = math.sqrt(2)
 S3: float = math.sqrt(9 / 8)  # XYZ → IVM volume conversion factor
+_S3 = S3
+
+
+def volume_xyz_to_ivm(xyz_volume: float) -> float:
+    """Convert XYZ cubic volume → IVM tetravolume (multiply by S3)."""
+    return xyz_volume * _S3
+
+
+def volume_ivm_to_xyz(ivm_volume: float) -> float:
+    """Convert IVM tetravolume → XYZ cubic volume (divide by S3)."""
+    return ivm_volume / _S3
+
+
+def volume_xyz_to_ivm_batch(xyz_volumes):
+    """Array form of volume_xyz_to_ivm (one vectorised multiply).  Requires NumPy."""
+    if np is None:
+        raise ImportError("volume_xyz_to_ivm_batch requires numpy")
+    return np.asarray(xyz_volumes, dtype=np.float64) * _S3
+
+
+def volume_ivm_to_xyz_batch(ivm_volumes):
+    """Array form of volume_ivm_to_xyz.  Requires NumPy."""
+    if np is None:
+        raise ImportError("volume_ivm_to_xyz_batch requires numpy")
+    return np.asarray(ivm_volumes, dtype=np.float64) / _S3
 
 
 @dataclass(frozen=True)
@@ -59,13 +90,9 @@ class SynergeticsConstants:
     # Phi — golden ratio (relevant to Icosa/Pentadodeca)
     PHI: float = (1 + math.sqrt(5)) / 2  # 1.6180339887…
 
-    def volume_xyz_to_ivm(self, xyz_volume: float) -> float:
-        """Convert XYZ cubic volume → IVM tetravolume (multiply by S3)."""
-        return xyz_volume * self.S3
-
-    def volume_ivm_to_xyz(self, ivm_volume: float) -> float:
-        """Convert IVM tetravolume → XYZ cubic volume (divide by S3)."""
-        return ivm_volume / self.S3
+    # S3 is fixed, so the conversions need no instance state
+    volume_xyz_to_ivm = staticmethod(volume_xyz_to_ivm)
+    volume_ivm_to_xyz = staticmethod(volume_ivm_to_xyz)
 
 
 # Singleton instances
@@ -88,21 +115,38 @@ class IVMGrid:
         self.frequency = frequency
         logger.info("[IVMGrid] Created freq=%d", frequency)
 
+    @property
+    def frequency(self) -> int:
+        return self._frequency
+
+    @frequency.setter
+    def frequency(self, f: int) -> None:
+        # Powers and reciprocals are fixed per frequency; derive them once here
+        self._frequency = f
+        self._f3 = f * f * f
+        self._inv_f = 1.0 / f if f else None
+        self._inv_f3 = self._inv_f * self._inv_f * self._inv_f if f else None
+
+    def _reciprocal(self, value):
+        if value is None:
+            raise ZeroDivisionError("IVMGrid frequency is 0")
+        return value
+
     @property
     def vertex_count(self) -> int:
         """Number of vertices in a freq-f IVM tetrahedron: (f+1)(f+2)(f+3)/6."""
-        f = self.frequency
+        f = self._frequency
         return (f + 1) * (f + 2) * (f + 3) // 6
 
     @property
     def tetra_count(self) -> int:
         """Number of tetrahedra in a freq-f IVM tetrahedron: f³."""
-        return self.frequency ** 3
+        return self._f3
 
     @property
     def octa_count(self) -> int:
         """Number of octahedra: f(f-1)(f-2)/6 for f ≥ 3."""
-        f = self.frequency
+        f = self._frequency
         if f < 3:
             return 0
         return f * (f - 1) * (f - 2) // 6
@@ -110,11 +154,11 @@ class IVMGrid:
     @property
     def edge_length(self) -> float:
         """Edge length at this frequency (D units)."""
-        return 1.0 / self.frequency
+        return self._reciprocal(self._inv_f)
 
     def volume_tetra(self) -> float:
         """Volume of a single tetrahedron at this frequency (tetravolumes)."""
-        return (1.0 / self.frequency) ** 3
+        return self._reciprocal(self._inv_f3)
 
     def volume_octa(self) -> float:
         """Volume of a single octahedron at this frequency (tetravolumes)."""
@@ -14,18 +14,32 @@ from __future__ import annotations
 
 import logging
 import math
-from typing import Tuple, Optional
+from typing import Iterable, Tuple, Optional, Union
+
+# NumPy is an optional accelerator; only QuadrayArray needs it.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
 ROOT2: float = math.sqrt(2)          # 1.4142135623730951
 S3: float = math.sqrt(9 / 8)         # 1.0606601717798212
+_INV_ROOT2: float = 1.0 / ROOT2      # 0.7071067811865475, hoisted out of to_xyz
+_new = object.__new__                # bound once for Quadray._unchecked
 
 
 class Quadray:
-    """4D tetrahedral coordinate (a, b, c, d)."""
+    """4D tetrahedral coordinate (a, b, c, d).
+
+    ``==`` and ``hash`` compare the normalised components rounded to 4
+    decimals; use ``equals`` for a tolerance-based comparison.  Treat
+    instances as immutable: ``normalized``, the equality key and
+    ``to_key`` are cached on first use.
+    """
 
-    __slots__ = ("a", "b", "c", "d")
+    __slots__ = ("a", "b", "c", "d", "_norm", "_eq_key", "_key")
 
     # ── Construction ─────────────────────────────────────────────────────
 
@@ -36,17 +50,42 @@ class Quadray:
         self.c = float(c)
         self.d = float(d)
 
+    @classmethod
+    def _unchecked(cls, a: float, b: float, c: float, d: float) -> Quadray:
+        """Construct without float() coercion — callers must pass floats."""
+        self = _new(cls)
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+        return self
+
     def clone(self) -> Quadray:
         """Return an independent copy."""
-        return Quadray(self.a, self.b, self.c, self.d)
+        return Quadray._unchecked(self.a, self.b, self.c, self.d)
 
     # ── Normalisation ────────────────────────────────────────────────────
 
     def normalized(self) -> Quadray:
         """Zero-minimum normalisation: subtract the minimum component
-        from all four so that at least one component is zero."""
-        m = min(self.a, self.b, self.c, self.d)
-        return Quadray(self.a - m, self.b - m, self.c - m, self.d - m)
+        from all four so that at least one component is zero.
+
+        An already-normalised Quadray is returned as-is; otherwise the
+        result is cached in _norm (never self-referencing, so no cycle).
+        """
+        try:
+            return self._norm
+        except AttributeError:
+            a, b, c, d = self.a, self.b, self.c, self.d
+            # pairwise min: ~5x cheaper than the variadic min() builtin
+            m = a if a < b else b
+            k = c if c < d else d
+            m = m if m < k else k
+            if m == 0:
+                return self
+            n = Quadray._unchecked(a - m, b - m, c - m, d - m)
+            self._norm = n
+            return n
 
     # ── Cartesian / XYZ conversion ───────────────────────────────────────
 
@@ -55,33 +94,40 @@ class Quadray:
 
         Uses the standard tetrahedron-vertex mapping scaled by 1/√2.
         """
-        s = 1.0 / ROOT2
-        x = s * (self.a - self.b - self.c + self.d)
-        y = s * (self.a - self.b + self.c - self.d)
-        z = s * (self.a + self.b - self.c - self.d)
-        return (x, y, z)
+        a, b, c, d = self.a, self.b, self.c, self.d
+        s = _INV_ROOT2
+        return (s * (a - b - c + d), s * (a - b + c - d), s * (a + b - c - d))
 
     @classmethod
     def from_xyz(cls, x: float, y: float, z: float) -> Quadray:
         """Create a normalised Quadray from Cartesian coordinates."""
-        s = 1.0 / ROOT2
-        a = s * (max(0, x) + max(0, y) + max(0, z))
-        b = s * (max(0, -x) + max(0, -y) + max(0, z))
-        c = s * (max(0, -x) + max(0, y) + max(0, -z))
-        d = s * (max(0, x) + max(0, -y) + max(0, -z))
+        # Branchless max(0, ±v): (|v| ± v) / 2, exact in binary floating point
+        ax, ay, az = abs(x), abs(y), abs(z)
+        px, py, pz = (ax + x) * 0.5, (ay + y) * 0.5, (az + z) * 0.5
+        nx, ny, nz = (ax - x) * 0.5, (ay - y) * 0.5, (az - z) * 0.5
+        s = _INV_ROOT2
+        a = s * (px + py + pz)
+        b = s * (nx + ny + pz)
+        c = s * (nx + py + nz)
+        d = s * (px + ny + nz)
         return cls(a, b, c, d).normalized()
 
     # ── Arithmetic ───────────────────────────────────────────────────────
 
     def __add__(self, other: Quadray) -> Quadray:
-        return Quadray(
-            self.a + other.a, self.b + other.b,
-            self.c + other.c, self.d + other.d,
-        ).normalized()
+        # normalised inline: no temporary Quadray, nothing cached
+        a = self.a + other.a
+        b = self.b + other.b
+        c = self.c + other.c
+        d = self.d + other.d
+        m = a if a < b else b
+        k = c if c < d else d
+        m = m if m < k else k
+        return Quadray._unchecked(a - m, b - m, c - m, d - m)
 
     def __sub__(self, other: Quadray) -> Quadray:
         """Subtraction (NOT normalised — preserves sign for distance calc)."""
-        return Quadray(
+        return Quadray._unchecked(
             self.a - other.a, self.b - other.b,
             self.c - other.c, self.d - other.d,
         )
@@ -96,19 +142,22 @@ class Quadray:
         return self.__mul__(scalar)
 
     def __neg__(self) -> Quadray:
-        return Quadray(-self.a, -self.b, -self.c, -self.d)
+        return Quadray._unchecked(-self.a, -self.b, -self.c, -self.d)
 
     # ── Metrics ──────────────────────────────────────────────────────────
 
     def length(self) -> float:
         """Quadray vector length: √((a² + b² + c² + d²) / 2)."""
-        return math.sqrt(
-            (self.a**2 + self.b**2 + self.c**2 + self.d**2) / 2
-        )
+        a, b, c, d = self.a, self.b, self.c, self.d
+        return math.sqrt((a * a + b * b + c * c + d * d) * 0.5)
 
     def distance_to(self, other: Quadray) -> float:
-        """Euclidean distance via subtraction → length."""
-        return (self - other).length()
+        """Euclidean distance: length of (self − other), without the temporary."""
+        da = self.a - other.a
+        db = self.b - other.b
+        dc = self.c - other.c
+        dd = self.d - other.d
+        return math.sqrt((da * da + db * db + dc * dc + dd * dd) * 0.5)
 
     # ── Equality / Hashing ───────────────────────────────────────────────
 
@@ -123,22 +172,40 @@ class Quadray:
             and abs(n1.d - n2.d) < epsilon
         )
 
+    def _rounded(self) -> Tuple[float, float, float, float]:
+        """Normalised components rounded to 4 decimals (the ==/hash key)."""
+        try:
+            return self._eq_key
+        except AttributeError:
+            a, b, c, d = self.a, self.b, self.c, self.d
+            m = a if a < b else b
+            k = c if c < d else d
+            m = m if m < k else k
+            self._eq_key = (round(a - m, 4), round(b - m, 4),
+                            round(c - m, 4), round(d - m, 4))
+            return self._eq_key
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Quadray):
             return NotImplemented
-        return self.equals(other)
+        return self._rounded() == other._rounded()
 
     def __hash__(self) -> int:
-        n = self.normalized()
-        return hash((round(n.a, 4), round(n.b, 4),
-                      round(n.c, 4), round(n.d, 4)))
+        return hash(self._rounded())
 
     # ── Key / String ─────────────────────────────────────────────────────
 
     def to_key(self) -> str:
         """Integer-rounded normalised key for Maps/Sets."""
-        n = self.normalized()
-        return f"{round(n.a)},{round(n.b)},{round(n.c)},{round(n.d)}"
+        try:
+            return self._key
+        except AttributeError:
+            a, b, c, d = self.a, self.b, self.c, self.d
+            m = a if a < b else b
+            k = c if c < d else d
+            m = m if m < k else k
+            self._key = f"{round(a - m)},{round(b - m)},{round(c - m)},{round(d - m)}"
+            return self._key
 
     def __repr__(self) -> str:
         return (f"Quadray({self.a:.4f}, {self.b:.4f}, "
@@ -154,10 +221,21 @@ class Quadray:
         return (self.a, self.b, self.c, self.d)
 
     def __iter__(self):
-        return iter(self.as_tuple())
+        yield self.a
+        yield self.b
+        yield self.c
+        yield self.d
 
     def __getitem__(self, idx: int) -> float:
-        return self.as_tuple()[idx]
+        if idx == 0:
+            return self.a
+        if idx == 1:
+            return self.b
+        if idx == 2:
+            return self.c
+        if idx == 3:
+            return self.d
+        return self.as_tuple()[idx]  # negative indices, slices, IndexError
 
     def __len__(self) -> int:
         return 4
@@ -175,4 +253,115 @@ Quadray.D = Quadray(0, 0, 0, 1)  # type: ignore[attr-defined]
 Quadray.BASIS = [Quadray.A, Quadray.B, Quadray.C, Quadray.D]  # type: ignore[attr-defined]
 Quadray.ORIGIN = Quadray(0, 0, 0, 0)  # type: ignore[attr-defined]
 
+
+# ═══════════════════════════════════════════════════════════════════════════
+# QuadrayArray  (structure-of-arrays batch of Quadrays, NumPy-backed)
+# ═══════════════════════════════════════════════════════════════════════════
+
+class QuadrayArray:
+    """N Quadrays stored as one contiguous (N, 4) float64 array.
+
+    Batch counterpart of Quadray: metrics run as single vectorised NumPy
+    expressions instead of N Python method calls.  Like ``Quadray.__sub__``,
+    differences are not normalised.  Requires NumPy.
+    """
+
+    __slots__ = ("coords",)
+
+    def __init__(self, coords) -> None:
+        if np is None:
+            raise ImportError("QuadrayArray requires numpy")
+        arr = np.ascontiguousarray(coords, dtype=np.float64)
+        if arr.ndim != 2 or arr.shape[1] != 4:
+            raise ValueError(f"QuadrayArray expects shape (N, 4), got {arr.shape}")
+        self.coords = arr
+
+    @classmethod
+    def from_iterable(cls, quadrays: Iterable[Quadray]) -> QuadrayArray:
+        """Pack Quadray instances (or 4-tuples) into one array."""
+        rows = [(q[0], q[1], q[2], q[3]) for q in quadrays]
+        return cls(np.array(rows, dtype=np.float64).reshape(-1, 4))
+
+    @classmethod
+    def from_xyz(cls, xyz) -> QuadrayArray:
+        """Normalised Quadrays from an (N, 3) Cartesian array (batch Quadray.from_xyz)."""
+        xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+        mag = np.abs(xyz)
+        pos = (mag + xyz) * 0.5
+        neg = (mag - xyz) * 0.5
+        (px, py, pz), (nx, ny, nz) = pos.T, neg.T
+        out = np.stack((px + py + pz, nx + ny + pz,
+                        nx + py + nz, px + ny + nz), axis=1) * _INV_ROOT2
+        out -= out.min(axis=1, keepdims=True)
+        return cls(out)
+
+    # ── Sequence interface ───────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return self.coords.shape[0]
+
+    def __getitem__(self, idx: int) -> Quadray:
+        a, b, c, d = self.coords[idx].tolist()
+        return Quadray._unchecked(a, b, c, d)
+
+    def __iter__(self):
+        for row in self.coords.tolist():
+            yield Quadray._unchecked(*row)
+
+    def __repr__(self) -> str:
+        return f"QuadrayArray(n={len(self)})"
+
+    # ── Arithmetic ───────────────────────────────────────────────────────
+
+    def translate(self, delta: Union[QuadrayArray, Quadray]) -> QuadrayArray:
+        """Add delta to every row and normalise, in one vectorised pass.
+
+        Batch form of ``[q + delta for q in cells]``.
+        """
+        out = self.coords + _as_coords(delta)
+        out -= out.min(axis=1, keepdims=True)
+        return QuadrayArray(out)
+
+    def __add__(self, other: Union[QuadrayArray, Quadray]) -> QuadrayArray:
+        return self.translate(other)
+
+    # ── Conversion / metrics ─────────────────────────────────────────────
+
+    def to_xyz(self):
+        """(N, 3) Cartesian coordinates."""
+        return (self.coords @ _XYZ_T) * _INV_ROOT2
+
+    def length(self):
+        """(N,) Quadray vector lengths: √(Σ component² / 2)."""
+        return np.sqrt(np.einsum("ij,ij->i", self.coords, self.coords) * 0.5)
+
+    def distance_to(self, other: Union[QuadrayArray, Quadray]):
+        """(N,) row-wise distances to another array or a single Quadray."""
+        diff = self.coords - _as_coords(other)
+        return np.sqrt(np.einsum("ij,ij->i", diff, diff) * 0.5)
+
+    def angle_to(self, other: Union[QuadrayArray, Quadray]):
+        """(N,) row-wise angles in degrees, as geometry.angle_between."""
+        u = self.to_xyz()
+        v = other.to_xyz() if isinstance(other, QuadrayArray) else np.array(other.to_xyz())
+        cross = np.cross(u, v)
+        return np.degrees(np.arctan2(np.sqrt(np.einsum("ij,ij->i", cross, cross)),
+                                     (u * v).sum(axis=1)))
+
+    def manhattan(self, other: Union[QuadrayArray, Quadray]):
+        """(N,) row-wise Manhattan distances over the four components."""
+        return np.abs(self.coords - _as_coords(other)).sum(axis=1)
+
+
+# (4, 3): column j maps (a, b, c, d) → x/y/z; scaled by 1/√2 as in Quadray.to_xyz
+_XYZ_T = None if np is None else np.array(
+    ((1, -1, -1, 1), (1, -1, 1, -1), (1, 1, -1, -1)), dtype=np.float64).T
+
+
+def _as_coords(other: Union[QuadrayArray, Quadray]):
+    if isinstance(other, QuadrayArray):
+        return other.coords
+    return np.array(other.as_tuple(), dtype=np.float64)
+
+
 logger.debug("[Quadray] Module loaded – ROOT2=%.6f, S3=%.6f", ROOT2, S3)
@@ -5,6 +5,7 @@ Python port of projection.js.  Provides:
     • quadray_to_xyz / xyz_to_quadray  — coordinate conversions
     • project_quadray                  — 3D → 2D perspective projection
     • rotate_xyz                       — Euler-style X/Y rotation
+    • rotate_xyz_batch / project_quadray_batch — NumPy forms of the above
 """
 
 from __future__ import annotations
@@ -13,7 +14,13 @@ import logging
 import math
 from typing import Tuple, NamedTuple
 
-from .quadrays import Quadray, ROOT2
+from .quadrays import Quadray, QuadrayArray, ROOT2
+
+# NumPy is an optional accelerator for the batch APIs.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +82,24 @@ def rotate_xyz(
     return (x1, y2, z2)
 
 
+def rotation_matrix(rot_x: float = 0.0, rot_y: float = 0.0):
+    """3×3 matrix R with R @ v == rotate_xyz(*v, rot_x, rot_y).  Requires NumPy."""
+    if np is None:
+        raise ImportError("rotation_matrix requires numpy")
+    cos_y, sin_y = math.cos(rot_y), math.sin(rot_y)
+    cos_x, sin_x = math.cos(rot_x), math.sin(rot_x)
+    return np.array([
+        [cos_y, 0.0, -sin_y],
+        [-sin_x * sin_y, cos_x, -sin_x * cos_y],
+        [cos_x * sin_y, sin_x, cos_x * cos_y],
+    ])
+
+
+def rotate_xyz_batch(xyz, rot_x: float = 0.0, rot_y: float = 0.0):
+    """Rotate an (N, 3) array of points with one matmul (batch rotate_xyz)."""
+    return np.asarray(xyz, dtype=np.float64) @ rotation_matrix(rot_x, rot_y).T
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # 2D Screen Projection
 # ═══════════════════════════════════════════════════════════════════════════
@@ -120,16 +145,40 @@ def project_quadray(
     # Rotate
     rx, ry, rz = rotate_xyz(cx, cy, cz, rot_x, rot_y)
 
-    # Perspective divide
-    perspective = camera_dist / (camera_dist + rz) if (camera_dist + rz) != 0 else 1.0
+    # Perspective divide: one division, then x/y share k = scale·perspective
+    denom = camera_dist + rz
+    perspective = camera_dist / denom if denom != 0 else 1.0
+    k = scale * perspective
 
     return ScreenPoint(
-        x=center_x + rx * scale * perspective,
-        y=center_y - ry * scale * perspective,
+        x=center_x + rx * k,
+        y=center_y - ry * k,
         scale=perspective,
     )
 
 
+def project_quadray_batch(
+    quadrays: QuadrayArray, *,
+    rot_x: float = 0.0,
+    rot_y: float = 0.0,
+    scale: float = 35.0,
+    camera_dist: float = 5.0,
+    center_x: float = 300.0,
+    center_y: float = 300.0,
+):
+    """Project a whole QuadrayArray; batch form of project_quadray.
+
+    Chains to_xyz → rotate_xyz_batch → perspective divide.  Returns
+    ``(x, y, scale)`` as three (N,) arrays, the ScreenPoint fields.
+    """
+    rx, ry, rz = rotate_xyz_batch(quadrays.to_xyz(), rot_x, rot_y).T
+    denom = camera_dist + rz
+    nonzero = denom != 0
+    perspective = np.divide(camera_dist, denom, out=np.ones_like(denom), where=nonzero)
+    k = scale * perspective
+    return center_x + rx * k, center_y - ry * k, perspective
+
+
 def project_basis_axes(
     *,
     rot_x: float = 0.0,
@@ -0,0 +1,47 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.scaffold import GameScaffold, create_many
+
+# games/4d_generic, resolved from this file (config.GENERIC_DIR may not point here)
+GENERIC_DIR = Path(__file__).resolve().parents[2] / "4d_generic"
+
+
+class TestScaffold(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.games_dir = Path(self._tmpdir.name)
+        patcher = mock.patch("src.scaffold.GAMES_DIR", str(self.games_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_create_bundle(self):
+        """bundle=True inlines the shared modules into js/shared_bundle.js."""
+        with mock.patch("src.shared.GENERIC_DIR", str(GENERIC_DIR)):
+            game_dir = GameScaffold("bun", "4D Bun", bundle=True).create()
+        bundle = (game_dir / "js" / "shared_bundle.js").read_text(encoding="utf-8")
+        self.assertIn("// ── 4d_generic/quadray.js ──", bundle)
+        self.assertIn("shared_bundle.js", (game_dir / "index.html").read_text(encoding="utf-8"))
+        self.assertEqual(GameScaffold("bun", "4D Bun").validate(), [])
+
+    def test_create_bundle_missing_module_leaves_nothing(self):
+        """A failed bundle render must not leave a half-built game directory."""
+        with mock.patch("src.shared.GENERIC_DIR", str(self.games_dir / "missing")):
+            with self.assertRaises(FileNotFoundError):
+                GameScaffold("bun", "4D Bun", bundle=True).create()
+        self.assertFalse((self.games_dir / "4d_bun").exists())
+
+    def test_create_many(self):
+        """create_many scaffolds every spec and returns paths in spec order."""
+        paths = create_many([("alpha", "4D Alpha"), ("beta", "4D Beta")])
+        self.assertEqual(paths, [self.games_dir / "4d_alpha", self.games_dir / "4d_beta"])
+        for key, path in (("alpha", paths[0]), ("beta", paths[1])):
+            self.assertTrue((path / "js" / f"{key}_board.js").is_file())
+            self.assertEqual(GameScaffold(key, key).validate(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
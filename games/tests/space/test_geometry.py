@@ -1,5 +1,8 @@
 import unittest
-from src.space.geometry import verify_geometric_identities, Quadray, angle_between
+from src.space import geometry
+from src.space.geometry import verify_geometric_identities, Quadray, angle_between, generate_grid
+from src.space.quadrays import QuadrayArray
+from src.space.ivm import SYNERGETICS
 
 class TestGeometry(unittest.TestCase):
     def test_geometry_verification(self):
@@ -14,7 +17,47 @@ class TestGeometry(unittest.TestCase):
         q2 = Quadray(0, 1, 0, 0)
         angle = angle_between(q1, q2)
         # Tetrahedral angle is ~109.47 degrees
-        self.assertAlmostEqual(angle, 109.4712, places=3)
+        self.assertAlmostEqual(angle, SYNERGETICS.TETRAHEDRAL_ANGLE, places=3)
+
+    def test_quadray_eq_matches_hash(self):
+        """== and hash agree on the normalised 4-decimal key; equals() stays tolerant."""
+        q1, q2 = Quadray(1, 0, 0, 0), Quadray(2, 1, 1, 1)
+        self.assertEqual(q1, q2)
+        self.assertEqual(hash(q1), hash(q2))
+        self.assertEqual(len({q1, q2}), 1)
+        near = Quadray(1.00006, 0, 0, 0)
+        self.assertNotEqual(q1, near)
+        self.assertTrue(q1.equals(near))
+
+    @unittest.skipIf(geometry.np is None, "numpy not installed")
+    def test_grid_array_matches_grid(self):
+        """The ndarray grid has the same rows, in the same order, as generate_grid."""
+        arr = geometry.generate_grid_array(3)
+        self.assertEqual(arr.shape, (81, 4))
+        self.assertEqual([tuple(r) for r in arr.tolist()],
+                         [q.as_tuple() for q in generate_grid(3)])
+
+    @unittest.skipIf(geometry.np is None, "numpy not installed")
+    def test_quadray_array_matches_scalar(self):
+        """Vectorised QuadrayArray metrics agree with the per-Quadray methods."""
+        cells = generate_grid(3)
+        arr = QuadrayArray.from_iterable(cells)
+        origin = Quadray(1, 2, 0, 1)
+        for i, q in enumerate(cells):
+            self.assertAlmostEqual(arr.length()[i], q.length())
+            self.assertAlmostEqual(arr.distance_to(origin)[i], q.distance_to(origin))
+            for got, want in zip(arr.to_xyz()[i], q.to_xyz()):
+                self.assertAlmostEqual(got, want)
+        self.assertEqual(arr[5].as_tuple(), cells[5].as_tuple())
+
+    @unittest.skipIf(geometry.np is None, "numpy not installed")
+    def test_depth_sort_array_matches_depth_sort(self):
+        """Vectorised depth ordering reproduces depth_sort, ties included."""
+        cells = generate_grid(3)
+        expected = geometry.depth_sort(cells)
+        got = geometry.depth_sort_array(cells).to_dicts()
+        self.assertEqual([r["quadray"] for r in got], [r["quadray"] for r in expected])
+        self.assertEqual([r["pscale"] for r in got], [r["pscale"] for r in expected])
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,22 +1,31 @@
 import unittest
 import tempfile
-import json
 from pathlib import Path
 from src.core.registry import load_config
 from src.core.config import BASE_PORT, REPO_ROOT
 
 class TestConfig(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """One fixture file serves every load_config test."""
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls.config_path = str(Path(cls._tmpdir.name) / "config.json")
+        Path(cls.config_path).write_text('{"test_key": "test_value", "games": ["chess"]}')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmpdir.cleanup()
+
     def test_load_config(self):
         """Test loading configuration from JSON."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"test_key": "test_value"}, f)
-            config_path = f.name
-        
-        try:
-            config = load_config(config_path)
-            self.assertEqual(config["test_key"], "test_value")
-        finally:
-            Path(config_path).unlink()
+        config = load_config(self.config_path)
+        self.assertEqual(config["test_key"], "test_value")
+
+    def test_load_config_returns_independent_copies(self):
+        """Mutating a loaded config must not leak into later loads."""
+        first = load_config(self.config_path)
+        first["games"].append("doom")
+        self.assertEqual(load_config(self.config_path)["games"], ["chess"])
 
     def test_constants(self):
         """Test that key constants are defined."""
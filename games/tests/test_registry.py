@@ -1,5 +1,5 @@
 import unittest
-from src.core.registry import GAMES
+from src.core.registry import GAMES, GAME_META
 
 class TestRegistry(unittest.TestCase):
     def test_registry_games_exist(self):
@@ -14,5 +14,12 @@ class TestRegistry(unittest.TestCase):
         self.assertEqual(meta["dir"], "4d_minesweeper")
         self.assertEqual(meta["name"], "4D Minesweeper")
 
+    def test_game_meta_matches_games(self):
+        """GAME_META mirrors every GAMES entry with attribute access."""
+        self.assertEqual(set(GAME_META), set(GAMES))
+        meta = GAME_META["minesweeper"]
+        self.assertEqual(meta.dir, "4d_minesweeper")
+        self.assertEqual(meta.port_offset, GAMES["minesweeper"]["port_offset"])
+
 if __name__ == '__main__':
     unittest.main()
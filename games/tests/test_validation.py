@@ -1,17 +1,42 @@
+import os
+import tempfile
 import unittest
 from pathlib import Path
-from src.qa.validation import validate_game
+from src.core.registry import GAMES
+from src.qa.validation import validate_game, _max_mtime_bfs
+
+# games/ — resolved from this file so the tests don't depend on the cwd
+GAMES_DIR = Path(__file__).resolve().parent.parent
 
 class TestValidation(unittest.TestCase):
     def test_validation_minesweeper(self):
         """Validation should pass for the known-good Minesweeper game."""
-        # Assume we are running from repo root
-        repo_root = Path.cwd() / "games"
-        if not repo_root.exists():
-            repo_root = Path.cwd() # Fallback
-            
-        issues = validate_game(repo_root, "minesweeper")
+        issues = validate_game(GAMES_DIR, "minesweeper")
         self.assertEqual(issues, [], f"Minesweeper validation failed: {issues}")
 
+    def test_validate_game_sees_edits_that_keep_mtimes(self):
+        """Cached results must not survive a change that leaves every mtime as it was."""
+        with tempfile.TemporaryDirectory() as tmp:
+            game_dir = Path(tmp) / GAMES["minesweeper"]["dir"]
+            game_dir.mkdir()
+            before = _max_mtime_bfs(game_dir)
+            self.assertIn("missing AGENTS.md", validate_game(Path(tmp), "minesweeper"))
+            (game_dir / "AGENTS.md").write_text("# Agents")
+            os.utime(game_dir / "AGENTS.md", ns=(before, before))
+            os.utime(game_dir, ns=(before, before))
+            self.assertEqual(_max_mtime_bfs(game_dir), before)
+            self.assertNotIn("missing AGENTS.md", validate_game(Path(tmp), "minesweeper"))
+
+    def test_audit_stamp_tracks_nested_edits(self):
+        """The audit-cache stamp must change when a file inside js/ changes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            js_file = Path(tmp) / "js" / "game.js"
+            js_file.parent.mkdir()
+            js_file.write_text("// game")
+            before = _max_mtime_bfs(Path(tmp))
+            os.utime(js_file, ns=(before + 10**9, before + 10**9))
+            self.assertEqual(_max_mtime_bfs(Path(tmp)), before + 10**9)
+        self.assertEqual(_max_mtime_bfs(Path(tmp)), -1)
+
 if __name__ == '__main__':
     unittest.main()